@@ -0,0 +1,76 @@
+"""Micro-benchmark of the per-write cost of the ADT Pulse entities.
+
+Measures, per entity class, the time _handle_coordinator_update takes when
+it writes the state (fingerprint cleared first) and when the write is
+skipped as redundant.  The update task is stopped so only the entity code
+runs.
+"""
+
+from __future__ import annotations
+
+from statistics import mean
+from time import perf_counter
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from custom_components.adtpulse.alarm_control_panel import ADTPulseAlarm
+from custom_components.adtpulse.base_entity import ADTPulseEntity
+from custom_components.adtpulse.binary_sensor import (
+    ADTPulseGatewaySensor,
+    ADTPulseZoneSensor,
+)
+from custom_components.adtpulse.const import ADTPULSE_DOMAIN
+
+from .helpers import report, setup_mock_entry
+from .mock_portal import MockPulsePortal
+
+pytestmark = pytest.mark.parametrize("expected_lingering_tasks", [True])
+
+ROUNDS = 500
+
+
+def _time_updates(entities: list[ADTPulseEntity], force_write: bool) -> list[float]:
+    samples: list[float] = []
+    for _ in range(ROUNDS):
+        for entity in entities:
+            if force_write:
+                # pylint: disable-next=protected-access
+                entity._state_fingerprint = None
+            start = perf_counter()
+            # pylint: disable-next=protected-access
+            entity._handle_coordinator_update()
+            samples.append(perf_counter() - start)
+    return samples
+
+
+def _format(name: str, samples: list[float]) -> str:
+    return (
+        f"{name}: n={len(samples)} mean={mean(samples) * 1e6:.1f}us "
+        f"min={min(samples) * 1e6:.1f}us"
+    )
+
+
+async def test_entity_write_cost(
+    hass: HomeAssistant, mock_portal: tuple[MockPulsePortal, str]
+) -> None:
+    """Per-write cost of zone, gateway and alarm entities."""
+    portal, url = mock_portal
+    entry = await setup_mock_entry(hass, portal, url)
+    await hass.data[ADTPULSE_DOMAIN][entry.entry_id].stop()
+
+    entities: list[ADTPulseEntity] = [
+        entity
+        for platform in async_get_platforms(hass, ADTPULSE_DOMAIN)
+        for entity in platform.entities.values()
+    ]
+    lines: list[str] = []
+    for entity_class in (ADTPulseZoneSensor, ADTPulseGatewaySensor, ADTPulseAlarm):
+        class_entities = [e for e in entities if isinstance(e, entity_class)]
+        assert class_entities
+        name = entity_class.__name__
+        lines.append(_format(f"{name} write", _time_updates(class_entities, True)))
+        lines.append(_format(f"{name} skipped", _time_updates(class_entities, False)))
+    report(*lines)
+    assert await hass.config_entries.async_unload(entry.entry_id)
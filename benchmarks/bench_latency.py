@@ -0,0 +1,145 @@
+"""End-to-end latency benchmarks against the mock Pulse portal.
+
+Measures:
+    * time from a scripted zone change on the portal to the zone sensor's
+      async_write_ha_state
+    * time from a scripted alarm change to the alarm panel's write
+    * arm/disarm round trip through ADTPulseAlarm._perform_alarm_action, and
+      until the new status is confirmed by the portal
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    STATE_ALARM_ARMED_AWAY,
+    STATE_ALARM_DISARMED,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.adtpulse.alarm_control_panel import ALARM_MAP, ADTPulseAlarm
+from custom_components.adtpulse.binary_sensor import ADTPulseZoneSensor
+from custom_components.adtpulse.const import ADTPULSE_DOMAIN
+
+from .helpers import (
+    EntityWrite,
+    WriteRecorder,
+    report,
+    setup_mock_entry,
+    summarize,
+)
+from .mock_portal import ChangeRecord, MockPulsePortal
+
+pytestmark = pytest.mark.parametrize("expected_lingering_tasks", [True])
+
+
+def _write_matches(change: ChangeRecord):
+    def predicate(write: EntityWrite) -> bool:
+        entity = write.entity
+        if change.kind == "alarm":
+            return isinstance(entity, ADTPulseAlarm) and write.state == ALARM_MAP.get(
+                change.value
+            )
+        # pylint: disable=protected-access
+        if (
+            isinstance(entity, ADTPulseZoneSensor)
+            and entity._zone.zone_id == change.target
+        ):
+            state, trouble = change.value
+            if entity._is_trouble_indicator:
+                expected_on = trouble is not None
+            else:
+                expected_on = state != "OK"
+            return write.state == (STATE_ON if expected_on else STATE_OFF)
+        return False
+
+    return predicate
+
+
+async def test_change_to_write_latency(
+    hass: HomeAssistant, mock_portal: tuple[MockPulsePortal, str], monkeypatch
+) -> None:
+    """Scripted zone/alarm change on the portal to entity state write."""
+    portal, url = mock_portal
+    recorder = WriteRecorder()
+    recorder.wrap(monkeypatch, ADTPulseZoneSensor)
+    recorder.wrap(monkeypatch, ADTPulseAlarm)
+    entry = await setup_mock_entry(hass, portal, url)
+
+    changes = await portal.run_scenario()
+    zone_latency: list[float] = []
+    alarm_latency: list[float] = []
+    for change in changes:
+        write = await recorder.wait_for_write(change.applied_at, _write_matches(change))
+        latency = write.written_at - change.applied_at
+        (alarm_latency if change.kind == "alarm" else zone_latency).append(latency)
+
+    coordinators = hass.data[ADTPULSE_DOMAIN][entry.entry_id].coordinators.values()
+    report(
+        summarize("zone change -> write", zone_latency),
+        summarize("alarm change -> write", alarm_latency),
+        f"portal requests: {portal.request_counts}",
+        "entity writes on update: performed="
+        f"{sum(c.performed_writes for c in coordinators)} "
+        f"skipped={sum(c.skipped_writes for c in coordinators)} "
+        f"suppressed={sum(c.suppressed_writes for c in coordinators)}",
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_arm_disarm_round_trip(
+    hass: HomeAssistant, mock_portal: tuple[MockPulsePortal, str], monkeypatch
+) -> None:
+    """Arm/disarm through the alarm entity until confirmed by the portal."""
+    portal, url = mock_portal
+    recorder = WriteRecorder()
+    recorder.wrap(monkeypatch, ADTPulseAlarm)
+    action_times: list[float] = []
+    # pylint: disable-next=protected-access
+    original_action = ADTPulseAlarm._perform_alarm_action
+
+    async def timed_action(self, *args):
+        start = perf_counter()
+        try:
+            await original_action(self, *args)
+        finally:
+            action_times.append(perf_counter() - start)
+
+    monkeypatch.setattr(ADTPulseAlarm, "_perform_alarm_action", timed_action)
+    entry = await setup_mock_entry(hass, portal, url)
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "alarm_control_panel",
+        "adtpulse",
+        f"adt_pulse_alarm_{portal.scenario.site_id}",
+    )
+    assert entity_id is not None
+
+    confirm_times: list[float] = []
+    for service, expected in (
+        ("alarm_arm_away", STATE_ALARM_ARMED_AWAY),
+        ("alarm_disarm", STATE_ALARM_DISARMED),
+    ) * 3:
+        start = perf_counter()
+        await hass.services.async_call(
+            "alarm_control_panel", service, {ATTR_ENTITY_ID: entity_id}, blocking=True
+        )
+        await recorder.wait_for_write(start, lambda w, e=expected: w.state == e)
+        confirm_times.append(perf_counter() - start)
+
+    manager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+    coordinator = manager.coordinators[portal.scenario.site_id]
+    report(
+        summarize("_perform_alarm_action round trip", action_times),
+        summarize("arm/disarm confirmed by portal", confirm_times),
+        *(
+            summarize(f"alarm command {command}", list(latencies))
+            for command, latencies in coordinator.alarm_commands.latencies.items()
+        ),
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,124 @@
+"""Recorder growth of the ADT Pulse entities per simulated hour.
+
+Sets up the basic scenario with the recorder on an in-memory SQLite database
+and plays an hour of activity straight into the coordinator, the update task
+is stopped so nothing else writes:
+
+* an update every UPDATE_SECONDS, each moving the gateway's last and next
+  update times and opening or closing one zone in turn,
+* ALARM_CHANGES_PER_HOUR alarm changes, alternating between away and off.
+
+Then counts the states and state_attributes rows and attribute bytes the
+recorder wrote, both with the entities' volatile attributes unrecorded and
+with every attribute recorded as before.  That the volatile attributes are
+left out at all is tested in tests/test_recorder.py.
+"""
+
+from __future__ import annotations
+
+from itertools import cycle
+from time import time
+
+import pytest
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import StateAttributes, States
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from pyadtpulse.alarm_panel import ADT_ALARM_AWAY, ADT_ALARM_OFF
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+from sqlalchemy import func
+
+from custom_components.adtpulse.alarm_control_panel import ADTPulseAlarm
+from custom_components.adtpulse.binary_sensor import (
+    ADTPulseGatewaySensor,
+    ADTPulseZoneSensor,
+)
+from custom_components.adtpulse.const import ADTPULSE_DOMAIN
+from custom_components.adtpulse.coordinator import ADTPulseUpdateManager
+
+from .helpers import report, setup_mock_entry
+from .mock_portal import MockPulsePortal
+
+pytestmark = pytest.mark.parametrize("expected_lingering_tasks", [True])
+
+UPDATE_SECONDS = 30
+ALARM_CHANGES_PER_HOUR = 4
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(recorder_db_url, enable_custom_integrations):
+    """Enable custom integrations, the recorder database has to come first."""
+    yield
+
+
+def _count_rows(instance: Recorder) -> tuple[int, int, int]:
+    """Return the states rows, attribute rows and attribute bytes stored."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        states = session.query(func.count(States.state_id)).scalar()
+        attributes, attribute_bytes = session.query(
+            func.count(StateAttributes.attributes_id),
+            func.coalesce(func.sum(func.length(StateAttributes.shared_attrs)), 0),
+        ).one()
+    return states, attributes, attribute_bytes
+
+
+async def _play_hour(hass: HomeAssistant, manager: ADTPulseUpdateManager) -> None:
+    site = manager.adtpulse.site
+    zones = site.zones_as_dict
+    assert zones is not None
+    zone_ids = cycle(sorted(zones))
+    updates = 3600 // UPDATE_SECONDS
+    alarm_every = updates // ALARM_CHANGES_PER_HOUR
+    now = int(time())
+    for update in range(updates):
+        now += UPDATE_SECONDS
+        site.gateway.last_update = now
+        site.gateway.next_update = now + UPDATE_SECONDS
+        zone_id = next(zone_ids)
+        zone = zones[zone_id]
+        zone.state = "Open" if zone.state == "OK" else "OK"
+        zone.last_activity_timestamp = now
+        alarm_changed = update % alarm_every == alarm_every - 1
+        if alarm_changed:
+            panel = site.alarm_control_panel
+            panel.status = ADT_ALARM_AWAY if panel.is_disarmed else ADT_ALARM_OFF
+            # pylint: disable-next=protected-access
+            panel._last_arm_disarm = now
+        manager.async_set_updated_data((alarm_changed, {zone_id}))
+        await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("recorded", [False, True], ids=["unrecorded", "recorded"])
+async def test_recorder_growth(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    mock_portal: tuple[MockPulsePortal, str],
+    monkeypatch,
+    recorded: bool,
+) -> None:
+    """States and attribute rows written per hour of activity."""
+    if recorded:
+        for entity_class in (ADTPulseZoneSensor, ADTPulseGatewaySensor, ADTPulseAlarm):
+            monkeypatch.setattr(
+                entity_class, "_Entity__combined_unrecorded_attributes", frozenset()
+            )
+    portal, url = mock_portal
+    entry = await setup_mock_entry(hass, portal, url)
+    manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+    await manager.stop()
+    await async_wait_recording_done(hass)
+    before = await recorder_mock.async_add_executor_job(_count_rows, recorder_mock)
+
+    await _play_hour(hass, manager)
+    await async_wait_recording_done(hass)
+    after = await recorder_mock.async_add_executor_job(_count_rows, recorder_mock)
+
+    states, attributes, attribute_bytes = (b - a for a, b in zip(before, after))
+    report(
+        f"{'recorded' if recorded else 'unrecorded'} volatile attributes, per hour: "
+        f"states={states} rows, state_attributes={attributes} rows "
+        f"({attribute_bytes / 1024:.1f}KiB)"
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
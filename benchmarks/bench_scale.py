@@ -0,0 +1,125 @@
+"""Scale benchmark of setup time, memory and update CPU against zone count.
+
+Each case serves sites with the given number of zones from mock portals and
+sets up one config entry per site:
+
+* setup time: async_setup_entry of the first site, including login and
+  parsing its pages.
+* memory: Python memory still allocated after setting up a second site of
+  the same size under tracemalloc, per zone (a state sensor, a trouble
+  sensor and a device each), with a fixed share that dominates small sites.
+* update CPU: process and wall time of handing an update that changes k
+  zones to the first site's coordinator until every state write is done.
+  The update task is stopped and zones are changed in pyadtpulse's site
+  directly, so it's just the integration and Home Assistant's state machine.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from itertools import cycle
+from statistics import median
+from time import perf_counter, process_time
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.adtpulse.const import ADTPULSE_DOMAIN
+from custom_components.adtpulse.coordinator import ADTPulseUpdateManager
+
+from .helpers import report, setup_mock_entry
+from .mock_portal import MockPulsePortal, MockZone, Scenario, start_mock_portal
+
+pytestmark = pytest.mark.parametrize("expected_lingering_tasks", [True])
+
+ZONE_COUNTS = (10, 100, 500, 2000)
+ZONE_TAGS = ("doorWindow", "motion", "doorWindow", "glass", "smoke", "flood", "co")
+UPDATE_ROUNDS = 20
+
+
+def _make_scenario(site_number: int, zone_count: int) -> Scenario:
+    tags = cycle(ZONE_TAGS)
+    return Scenario(
+        site_id=f"160301z{site_number:06d}",
+        site_name=f"Mock Site {site_number}",
+        zones=[
+            MockZone(zone_id, f"Zone {zone_id} {tag}", tag)
+            for zone_id, tag in zip(range(1, zone_count + 1), tags)
+        ],
+        steps=[],
+    )
+
+
+def _changed_zone_counts(zone_count: int) -> list[int]:
+    return sorted({k for k in (1, 10, 100, zone_count) if k <= zone_count})
+
+
+async def _time_updates(
+    hass: HomeAssistant, manager: ADTPulseUpdateManager, changed: int
+) -> tuple[float, float]:
+    """Return median process and wall seconds of an update changing zones."""
+    zones = manager.adtpulse.site.zones_as_dict
+    assert zones is not None
+    zone_ids = set(list(zones)[:changed])
+    cpu_samples: list[float] = []
+    wall_samples: list[float] = []
+    for round_number in range(UPDATE_ROUNDS):
+        state = "Open" if round_number % 2 == 0 else "OK"
+        for zone_id in zone_ids:
+            zones[zone_id].state = state
+            zones[zone_id].last_activity_timestamp += 1
+        cpu_start = process_time()
+        wall_start = perf_counter()
+        manager.async_set_updated_data((False, zone_ids))
+        await hass.async_block_till_done()
+        cpu_samples.append(process_time() - cpu_start)
+        wall_samples.append(perf_counter() - wall_start)
+    return median(cpu_samples), median(wall_samples)
+
+
+@pytest.mark.parametrize("zone_count", ZONE_COUNTS)
+async def test_scale(hass: HomeAssistant, socket_enabled, zone_count: int) -> None:
+    """Setup time, memory per zone and update CPU of sites of a given size."""
+    portals = [MockPulsePortal(_make_scenario(n, zone_count)) for n in (1, 2)]
+    runners = []
+    try:
+        urls = []
+        for portal in portals:
+            runner, url = await start_mock_portal(portal)
+            runners.append(runner)
+            urls.append(url)
+
+        start = perf_counter()
+        entry = await setup_mock_entry(hass, portals[0], urls[0])
+        setup_time = perf_counter() - start
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        second_entry = await setup_mock_entry(hass, portals[1], urls[1])
+        gc.collect()
+        memory = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        entity_count = len(hass.states.async_entity_ids())
+        manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+        await manager.stop()
+        lines = [
+            f"{zone_count} zones: setup={setup_time * 1000:.0f}ms "
+            f"memory={memory / 1024:.0f}KiB ({memory / zone_count:.0f}B/zone) "
+            f"entities={entity_count} (2 sites)"
+        ]
+        for changed in _changed_zone_counts(zone_count):
+            cpu, wall = await _time_updates(hass, manager, changed)
+            lines.append(
+                f"{zone_count} zones, {changed} changed: "
+                f"cpu={cpu * 1000:.2f}ms wall={wall * 1000:.2f}ms "
+                f"({cpu / changed * 1e6:.0f}us cpu/zone)"
+            )
+        report(*lines)
+        for config_entry in (entry, second_entry):
+            assert await hass.config_entries.async_unload(config_entry.entry_id)
+    finally:
+        for runner in runners:
+            await runner.cleanup()
@@ -0,0 +1,64 @@
+"""Fixtures for the ADT Pulse benchmarks."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from aiohttp import ClientSession, CookieJar
+from pyadtpulse import pulse_connection_properties
+from pyadtpulse.pulse_connection_properties import PulseConnectionProperties
+
+from .mock_portal import MockPulsePortal, Scenario, start_mock_portal
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading custom_components/adtpulse."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def allow_mock_service_host(monkeypatch):
+    """Let pyadtpulse accept the mock portal as its service host.
+
+    pyadtpulse only accepts the production hosts, so relax the check
+    rather than rewriting the host after the service is constructed.
+    """
+    original = PulseConnectionProperties.check_service_host
+
+    def check_service_host(service_host: str) -> None:
+        if service_host.startswith("http://127.0.0.1:"):
+            return
+        original(service_host)
+
+    monkeypatch.setattr(
+        PulseConnectionProperties, "check_service_host", staticmethod(check_service_host)
+    )
+    # the mock is addressed by IP, which aiohttp's default cookie jar refuses
+    monkeypatch.setattr(
+        pulse_connection_properties,
+        "ClientSession",
+        lambda *args, **kwargs: ClientSession(
+            *args, cookie_jar=CookieJar(unsafe=True), **kwargs
+        ),
+    )
+
+
+@pytest.fixture
+def scenario_name() -> str:
+    """Scenario to serve, override with indirect parametrization."""
+    return "basic"
+
+
+@pytest.fixture
+async def mock_portal(
+    socket_enabled, scenario_name: str
+) -> AsyncGenerator[tuple[MockPulsePortal, str], None]:
+    """Run the mock portal, yielding it and its base URL."""
+    portal = MockPulsePortal(Scenario.load(scenario_name))
+    runner, url = await start_mock_portal(portal)
+    yield portal, url
+    await runner.cleanup()
@@ -0,0 +1,134 @@
+"""Shared helpers for the ADT Pulse benchmarks."""
+
+from __future__ import annotations
+
+from logging import getLogger
+import asyncio
+from dataclasses import dataclass
+from statistics import median, quantiles
+from time import perf_counter
+from typing import Any, Callable
+
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.adtpulse.const import (
+    ADTPULSE_DOMAIN,
+    CONF_FINGERPRINT,
+    CONF_HOSTNAME,
+    CONF_MOTION_HOLD_TIME,
+    CONF_TROUBLE_DELAY,
+)
+
+from .mock_portal import MockPulsePortal
+
+LOG = getLogger(__name__)
+
+# keep the poll short so latency is dominated by the integration, not the sleep
+BENCH_POLL_INTERVAL = 0.5
+
+
+@dataclass(slots=True)
+class EntityWrite:
+    """A state write observed on an entity."""
+
+    written_at: float
+    entity: Entity
+    state: Any
+
+
+class WriteRecorder:
+    """Record every async_write_ha_state of the wrapped entity classes."""
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        self.writes: list[EntityWrite] = []
+        self._written = asyncio.Event()
+
+    def wrap(self, monkeypatch, entity_class: type[Entity]) -> None:
+        """Wrap async_write_ha_state of entity_class."""
+        original = entity_class.async_write_ha_state
+        recorder = self
+
+        @callback
+        def async_write_ha_state(entity: Entity) -> None:
+            original(entity)
+            recorder.writes.append(EntityWrite(perf_counter(), entity, entity.state))
+            recorder._written.set()
+
+        monkeypatch.setattr(entity_class, "async_write_ha_state", async_write_ha_state)
+
+    def first_write(
+        self, after: float, predicate: Callable[[EntityWrite], bool]
+    ) -> EntityWrite | None:
+        """Return the first write after a timestamp matching predicate."""
+        for write in self.writes:
+            if write.written_at >= after and predicate(write):
+                return write
+        return None
+
+    async def wait_for_write(
+        self,
+        after: float,
+        predicate: Callable[[EntityWrite], bool],
+        timeout: float = 30.0,
+    ) -> EntityWrite:
+        """Wait until a write matching predicate happens after a timestamp."""
+        async with asyncio.timeout(timeout):
+            while (write := self.first_write(after, predicate)) is None:
+                self._written.clear()
+                await self._written.wait()
+        return write
+
+
+async def setup_mock_entry(
+    hass: HomeAssistant,
+    portal: MockPulsePortal,
+    url: str,
+    options: dict[str, Any] | None = None,
+) -> MockConfigEntry:
+    """Create and set up a config entry pointed at the mock portal."""
+    entry = MockConfigEntry(
+        domain=ADTPULSE_DOMAIN,
+        title=f"ADT: Site {portal.scenario.site_id}",
+        data={
+            CONF_USERNAME: portal.username,
+            CONF_PASSWORD: portal.password,
+            CONF_FINGERPRINT: "mock-fingerprint",
+            CONF_HOSTNAME: url,
+        },
+        options=options
+        or {
+            CONF_SCAN_INTERVAL: BENCH_POLL_INTERVAL,
+            # measure the integration, not hold times meant to delay writes
+            CONF_MOTION_HOLD_TIME: 0,
+            CONF_TROUBLE_DELAY: 0,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def summarize(name: str, samples: list[float]) -> str:
+    """Format min/median/p95/max of samples (in seconds) as milliseconds."""
+    if not samples:
+        return f"{name}: no samples"
+    p95 = quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+    return (
+        f"{name}: n={len(samples)} "
+        f"min={min(samples) * 1000:.1f}ms "
+        f"median={median(samples) * 1000:.1f}ms "
+        f"p95={p95 * 1000:.1f}ms "
+        f"max={max(samples) * 1000:.1f}ms"
+    )
+
+
+def report(*lines: str) -> None:
+    """Emit benchmark results."""
+    for line in lines:
+        LOG.warning("%s", line)
+        print(line)  # noqa: T201
@@ -0,0 +1,478 @@
+"""Local stand-in for the ADT Pulse portal.
+
+Serves just enough of the Pulse web application for pyadtpulse to log in,
+discover a site, poll for changes and arm/disarm:
+
+    /                                   -> redirect exposing the API version
+    /myhome/<ver>/access/signin.jsp     -> login (POST) / login page (GET)
+    /myhome/<ver>/access/signout.jsp    -> logout
+    /myhome/<ver>/summary/summary.jsp   -> site summary (alarm + zone orb)
+    /myhome/<ver>/ajax/orb.jsp          -> zone orb
+    /myhome/<ver>/system/system.jsp     -> device list
+    /myhome/<ver>/system/device.jsp     -> device attributes
+    /myhome/<ver>/system/gateway.jsp    -> gateway attributes
+    /myhome/<ver>/Ajax/SyncCheckServ    -> sync check token
+    /myhome/<ver>/KeepAlive             -> keepalive
+    /myhome/<ver>/quickcontrol/armDisarm.jsp -> arm/disarm
+
+State changes are driven by a scenario (see scenarios/*.json).  Every change
+records a ``perf_counter`` timestamp so callers can compute the latency until
+Home Assistant observes it.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from html import escape
+from itertools import count
+from pathlib import Path
+from secrets import token_hex
+from time import perf_counter
+from typing import Any
+
+from aiohttp import web
+
+LOG = getLogger(__name__)
+
+API_VERSION = "27.0.0-140"
+API_PREFIX = f"/myhome/{API_VERSION}"
+SESSION_COOKIE = "JSESSIONID"
+SCENARIO_DIR = Path(__file__).parent / "scenarios"
+
+# orb text as shown on the portal for each alarm mode
+ALARM_TEXT = {
+    "off": "Disarmed",
+    "away": "Armed Away",
+    "stay": "Armed Stay",
+    "night": "Armed Night",
+}
+
+# system.jsp device type strings, pyadtpulse derives zone tags from these
+ZONE_TYPE_TEXT = {
+    "doorWindow": "Door/Window Sensor",
+    "motion": "Motion Sensor",
+    "glass": "Glass Break Detector",
+    "co": "Carbon Monoxide Detector",
+    "smoke": "Smoke/Heat Detector",
+    "flood": "Water/Flood Sensor",
+}
+
+
+@dataclass(slots=True)
+class MockZone:
+    """A zone served by the mock portal."""
+
+    zone_id: int
+    name: str
+    tag: str = "doorWindow"
+    state: str = "OK"
+    trouble: str | None = None
+    last_activity: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(slots=True)
+class ScenarioStep:
+    """A single scripted change.
+
+    Exactly one of zone/alarm/gateway_online is expected to be set.
+    """
+
+    delay: float
+    zone: int | None = None
+    state: str | None = None
+    trouble: str | None = None
+    alarm: str | None = None
+    gateway_online: bool | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ScenarioStep:
+        """Build a step from its JSON form."""
+        return cls(
+            delay=float(data.get("delay", 0.0)),
+            zone=data.get("zone"),
+            state=data.get("state"),
+            trouble=data.get("trouble"),
+            alarm=data.get("alarm"),
+            gateway_online=data.get("gateway_online"),
+        )
+
+
+@dataclass(slots=True)
+class Scenario:
+    """Site layout plus the scripted changes to apply to it."""
+
+    site_id: str
+    site_name: str
+    zones: list[MockZone]
+    steps: list[ScenarioStep]
+    alarm: str = "off"
+    arm_delay: float = 1.0
+
+    @classmethod
+    def load(cls, name_or_path: str | Path) -> Scenario:
+        """Load a scenario by name (from scenarios/) or by path."""
+        path = Path(name_or_path)
+        if not path.exists():
+            path = SCENARIO_DIR / f"{name_or_path}.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(
+            site_id=data["site_id"],
+            site_name=data["site_name"],
+            zones=[
+                MockZone(int(zone["id"]), zone["name"], zone.get("tag", "doorWindow"))
+                for zone in data["zones"]
+            ],
+            steps=[ScenarioStep.from_dict(step) for step in data.get("steps", [])],
+            alarm=data.get("alarm", "off"),
+            arm_delay=float(data.get("arm_delay", 1.0)),
+        )
+
+
+@dataclass(slots=True)
+class ChangeRecord:
+    """A change applied to the mock, with the time it became visible."""
+
+    change_id: int
+    kind: str
+    target: int | str
+    value: Any
+    applied_at: float
+
+
+class MockPulsePortal:
+    """aiohttp application emulating the Pulse portal for a single site."""
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        username: str = "user@example.com",
+        password: str = "password",
+    ) -> None:
+        """Initialize the mock portal.
+
+        Args:
+            scenario (Scenario): site layout and scripted changes
+            username (str): accepted login user name
+            password (str): accepted login password
+        """
+        self.scenario = scenario
+        self.username = username
+        self.password = password
+        self.zones: dict[int, MockZone] = {z.zone_id: z for z in scenario.zones}
+        self.alarm = scenario.alarm
+        self.gateway_online = True
+        self.sat = "4f7c2b1e-0000-4000-8000-" + token_hex(6)
+        self.changes: list[ChangeRecord] = []
+        self.request_counts: dict[str, int] = {}
+        self.login_count = 0
+        self._sessions: set[str] = set()
+        self._change_ids = count(1)
+        self._pending_sync = 0
+        self._sync_token = 10000
+        self._tasks: set[asyncio.Task] = set()
+
+    def make_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._count_middleware])
+        app.router.add_get("/", self._handle_root)
+        app.router.add_route("*", f"{API_PREFIX}/access/signin.jsp", self._handle_signin)
+        app.router.add_get(f"{API_PREFIX}/access/signout.jsp", self._handle_signout)
+        app.router.add_get(f"{API_PREFIX}/summary/summary.jsp", self._handle_summary)
+        app.router.add_get(f"{API_PREFIX}/ajax/orb.jsp", self._handle_orb)
+        app.router.add_get(f"{API_PREFIX}/system/system.jsp", self._handle_system)
+        app.router.add_get(f"{API_PREFIX}/system/device.jsp", self._handle_device)
+        app.router.add_get(f"{API_PREFIX}/system/gateway.jsp", self._handle_gateway)
+        app.router.add_get(f"{API_PREFIX}/Ajax/SyncCheckServ", self._handle_sync_check)
+        app.router.add_post(f"{API_PREFIX}/KeepAlive", self._handle_keepalive)
+        app.router.add_post(
+            f"{API_PREFIX}/quickcontrol/armDisarm.jsp", self._handle_arm_disarm
+        )
+        app.on_cleanup.append(self._cancel_tasks)
+        return app
+
+    # scenario driving
+
+    def apply_step(self, step: ScenarioStep) -> ChangeRecord:
+        """Apply a scenario step immediately and signal the sync check."""
+        if step.zone is not None:
+            zone = self.zones[step.zone]
+            if step.state is not None:
+                zone.state = step.state
+            zone.trouble = step.trouble
+            zone.last_activity = datetime.now()
+            return self._record("zone", zone.zone_id, (zone.state, zone.trouble))
+        if step.alarm is not None:
+            self.alarm = step.alarm
+            return self._record("alarm", self.scenario.site_id, step.alarm)
+        if step.gateway_online is not None:
+            self.gateway_online = step.gateway_online
+            return self._record("gateway", self.scenario.site_id, step.gateway_online)
+        raise ValueError(f"Scenario step {step} does not change anything")
+
+    async def run_scenario(self) -> list[ChangeRecord]:
+        """Apply every scenario step, honoring each step's delay."""
+        records = []
+        for step in self.scenario.steps:
+            await asyncio.sleep(step.delay)
+            records.append(self.apply_step(step))
+        return records
+
+    def _record(self, kind: str, target: int | str, value: Any) -> ChangeRecord:
+        self._pending_sync += 1
+        record = ChangeRecord(next(self._change_ids), kind, target, value, perf_counter())
+        self.changes.append(record)
+        LOG.debug("mock portal applied change %s", record)
+        return record
+
+    async def _cancel_tasks(self, _app: web.Application) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    # request helpers
+
+    @web.middleware
+    async def _count_middleware(self, request: web.Request, handler):
+        path = request.path.removeprefix(API_PREFIX)
+        self.request_counts[path] = self.request_counts.get(path, 0) + 1
+        return await handler(request)
+
+    @staticmethod
+    def _page(body: str) -> web.Response:
+        return web.Response(
+            text=f"<html><head></head><body>{body}</body></html>",
+            content_type="text/html",
+        )
+
+    def _signin_page(self, message: str | None = None) -> web.Response:
+        warning = ""
+        if message:
+            warning = f"<div id='warnMsgContents'>{escape(message)}</div>"
+        return self._page(f"{warning}<form id='signinForm'></form>")
+
+    def _require_login(self, request: web.Request) -> None:
+        # the portal bounces expired sessions back to the sign in page
+        if request.cookies.get(SESSION_COOKIE) not in self._sessions:
+            raise web.HTTPFound(f"{API_PREFIX}/access/signin.jsp?e=ns&partner=adt")
+
+    @staticmethod
+    def _pulse_time(when: datetime) -> str:
+        day = "Today" if when.date() == datetime.now().date() else when.strftime("%m/%d")
+        return f"{day}\xa0{when.strftime('%I:%M %p')}"
+
+    def _alarm_html(self) -> str:
+        text = ALARM_TEXT.get(self.alarm, "Status Unavailable")
+        return (
+            f"<span class='p_boldNormalTextLarge'>{text}. All Quiet.\n</span>"
+            "<input type='button' id='security_button_0' value='Arm Away' "
+            f"onclick=\"setArmState('away', 'sat={self.sat}&amp;href=x')\"/>"
+        )
+
+    def _orb_html(self) -> str:
+        # the portal sorts trouble zones first, tripped zones next, then OK zones
+        def sort_key(zone: MockZone) -> tuple[int, int]:
+            if zone.trouble:
+                return (0, zone.zone_id)
+            if zone.state != "OK":
+                return (1, zone.zone_id)
+            return (2, zone.zone_id)
+
+        rows = []
+        for zone in sorted(self.zones.values(), key=sort_key):
+            status = f"Trouble {zone.trouble}" if zone.trouble else zone.state
+            rows.append(
+                "<tr class='p_listRow'>"
+                "<td class='p_listRow'><canvas class='p_ic_icon_device' "
+                f"icon='devStat{zone.state}'></canvas></td>"
+                f"<td>{escape(status)}</td>"
+                f"<td><a>{escape(zone.name)}</a>"
+                f"<div class='p_grayNormalText'>Zone\xa0{zone.zone_id}</div></td>"
+                "<td><span class='devStatIcon' title='Last Event: "
+                f"{self._pulse_time(zone.last_activity)}'></span></td>"
+                "</tr>"
+            )
+        orb = "security" if self.gateway_online else "offline"
+        return (
+            f"<canvas id='ic_orb' orb='{orb}'></canvas>{self._alarm_html()}"
+            f"<table>{''.join(rows)}</table>"
+        )
+
+    @staticmethod
+    def _attribute_table(attributes: dict[str, str]) -> str:
+        rows = "".join(
+            f"<tr><td class='InputFieldDescriptionL'>{escape(key)}:</td>"
+            f"<td>{escape(value)}</td></tr>"
+            for key, value in attributes.items()
+        )
+        return f"<table>{rows}</table>"
+
+    # handlers
+
+    async def _handle_root(self, request: web.Request) -> web.Response:
+        raise web.HTTPFound(f"{API_PREFIX}/access/signin.jsp")
+
+    async def _handle_signin(self, request: web.Request) -> web.Response:
+        if request.method != "POST":
+            return self._signin_page()
+        form = await request.post()
+        if (
+            form.get("usernameForm") != self.username
+            or form.get("passwordForm") != self.password
+        ):
+            return self._signin_page("Sign In Unsuccessful")
+        session_id = token_hex(16)
+        self._sessions.add(session_id)
+        self.login_count += 1
+        response = web.HTTPFound(f"{API_PREFIX}/summary/summary.jsp")
+        response.set_cookie(SESSION_COOKIE, session_id, path="/")
+        raise response
+
+    async def _handle_signout(self, request: web.Request) -> web.Response:
+        self._sessions.discard(request.cookies.get(SESSION_COOKIE, ""))
+        return self._signin_page()
+
+    async def _handle_summary(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        site = self.scenario
+        return self._page(
+            f"<span id='p_singlePremise'>{escape(site.site_name)}</span>"
+            f"<a class='p_signoutlink' href='{API_PREFIX}/access/signout.jsp"
+            f"?networkid={site.site_id}&amp;partner=adt'>Sign Out</a>"
+            f"{self._orb_html()}"
+        )
+
+    async def _handle_orb(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        return self._page(self._orb_html())
+
+    async def _handle_system(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        rows = [
+            "<tr class='p_listRow' onclick=\"goToUrl('gateway.jsp');\">"
+            "<td><canvas title='Online'></canvas></td><td><a>Gateway</a></td>"
+            "<td></td><td></td><td>Gateway</td></tr>",
+            "<tr class='p_listRow' onclick=\"goToUrl('device.jsp?id=1');\">"
+            "<td><canvas title='Online'></canvas></td><td><a>Security Panel</a></td>"
+            "<td></td><td></td><td>Security Panel</td></tr>",
+        ]
+        for zone in self.zones.values():
+            rows.append(
+                f"<tr class='p_listRow' onclick=\"goToUrl('device.jsp?id="
+                f"{zone.zone_id + 1}');\">"
+                "<td><canvas title='Online'></canvas></td>"
+                f"<td><a>{escape(zone.name)}</a></td><td>{zone.zone_id}</td>"
+                f"<td></td><td>{ZONE_TYPE_TEXT.get(zone.tag, zone.tag)}</td></tr>"
+            )
+        return self._page(f"<table>{''.join(rows)}</table>")
+
+    async def _handle_device(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        if request.query.get("id") != "1":
+            raise web.HTTPNotFound()
+        return self._page(
+            self._attribute_table(
+                {
+                    "Name": "Security Panel",
+                    "Manufacturer/Provider": "ADT",
+                    "Type/Model": "Security Panel - Mock Panel",
+                    "Status": "Online",
+                }
+            )
+        )
+
+    async def _handle_gateway(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        now = datetime.now()
+        return self._page(
+            self._attribute_table(
+                {
+                    "Manufacturer": "ADT",
+                    "Model": "PGZNG1",
+                    "Serial Number": "5U020CN3MOCK",
+                    "Firmware Version": "24.0.0-9",
+                    "Hardware Version": "HW=3, BL=1.1.9b, PL=9.4.0.32.5, SKU=PGZNG1",
+                    "Primary Connection Type": "Broadband",
+                    "Broadband Connection Status": "Active",
+                    "Cellular Connection Status": "N/A",
+                    "Broadband LAN IP Address": "192.168.1.20",
+                    "Broadband LAN MAC": "a4:11:62:35:07:96",
+                    "Device LAN IP Address": "192.168.107.1",
+                    "Device LAN MAC": "a4:11:62:35:07:97",
+                    "Router LAN IP Address": "192.168.1.1",
+                    "Router WAN IP Address": "",
+                    "Last Update": self._pulse_time(now),
+                    "Next Update": self._pulse_time(now + timedelta(hours=1)),
+                }
+            )
+        )
+
+    async def _handle_sync_check(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        # single digit tokens tell pyadtpulse updates exist, large ones mean idle
+        if self._pending_sync:
+            self._pending_sync = 0
+            return web.Response(text="1-0-0", content_type="text/html")
+        self._sync_token += 1
+        return web.Response(text=f"{self._sync_token}-0-0", content_type="text/html")
+
+    async def _handle_keepalive(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        return web.Response(text="success", content_type="text/html")
+
+    async def _handle_arm_disarm(self, request: web.Request) -> web.Response:
+        self._require_login(request)
+        form = await request.post()
+        new_mode = str(form.get("arm", ""))
+        if new_mode not in ALARM_TEXT:
+            raise web.HTTPBadRequest()
+
+        async def complete_arm_disarm() -> None:
+            # the real panel takes a while to report the new status
+            await asyncio.sleep(self.scenario.arm_delay)
+            self.apply_step(ScenarioStep(delay=0.0, alarm=new_mode))
+
+        task = asyncio.get_running_loop().create_task(complete_arm_disarm())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return self._page("<div id='armDisarmResult'></div>")
+
+
+async def start_mock_portal(
+    portal: MockPulsePortal, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """Start serving the portal.
+
+    Returns:
+        tuple[web.AppRunner, str]: the runner (call cleanup() to stop) and the
+            base URL to use as the Pulse service host
+    """
+    runner = web.AppRunner(portal.make_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+async def _main() -> None:
+    from argparse import ArgumentParser  # pylint: disable=import-outside-toplevel
+
+    parser = ArgumentParser(description="Run the mock ADT Pulse portal")
+    parser.add_argument("scenario", nargs="?", default="basic")
+    parser.add_argument("--port", type=int, default=8123 + 1000)
+    args = parser.parse_args()
+    portal = MockPulsePortal(Scenario.load(args.scenario))
+    runner, url = await start_mock_portal(portal, port=args.port)
+    print(f"Mock ADT Pulse portal listening on {url}")  # noqa: T201
+    try:
+        await portal.run_scenario()
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -7,7 +7,8 @@ from __future__ import annotations
 
 from logging import getLogger
 from asyncio import gather
-from typing import Any
+from time import monotonic
+from typing import Any, Awaitable, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -22,6 +23,7 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.config_validation import config_entry_only_config_schema
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.loader import async_get_integration
 from pyadtpulse.const import (
     ADT_DEFAULT_KEEPALIVE_INTERVAL,
     ADT_DEFAULT_POLL_INTERVAL,
@@ -37,15 +39,24 @@ from pyadtpulse.pyadtpulse_async import PyADTPulseAsync
 
 from .const import (
     ADTPULSE_DOMAIN,
+    CONF_ACTIVE_POLL_INTERVAL,
     CONF_FINGERPRINT,
     CONF_HOSTNAME,
     CONF_KEEPALIVE_INTERVAL,
     CONF_RELOGIN_INTERVAL,
 )
-from .coordinator import ADTPulseDataUpdateCoordinator
+from .coordinator import ADTPulseUpdateManager
+from .metrics import ADTPulseMetricsView
+from .services import async_setup_services
+from .session import async_close_pulse_service, create_pulse_service
+from .supervisor import get_supervisor
+from .topology import ADTPulseTopologyStore
+from .utils import async_migrate_entities
 
 LOG = getLogger(__name__)
 
+_T = TypeVar("_T")
+
 SUPPORTED_PLATFORMS = ["alarm_control_panel", "binary_sensor", "sensor"]
 
 CONFIG_SCHEMA = config_entry_only_config_schema(ADTPULSE_DOMAIN)
@@ -65,6 +76,8 @@ async def async_setup(
         bool: True if successful
     """
     hass.data.setdefault(ADTPULSE_DOMAIN, {})
+    async_setup_services(hass)
+    hass.http.register_view(ADTPulseMetricsView)
     return True
 
 
@@ -86,6 +99,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     password = entry.data.get(CONF_PASSWORD)
     fingerprint = entry.data.get(CONF_FINGERPRINT)
     poll_interval = entry.options.get(CONF_SCAN_INTERVAL, ADT_DEFAULT_POLL_INTERVAL)
+    active_poll_interval = entry.options.get(CONF_ACTIVE_POLL_INTERVAL)
     keepalive = entry.options.get(
         CONF_KEEPALIVE_INTERVAL, ADT_DEFAULT_KEEPALIVE_INTERVAL
     )
@@ -98,20 +112,94 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         LOG.debug("Using ADT Pulse API host %s", host)
     if username is None or password is None or fingerprint is None:
         raise ConfigEntryAuthFailed("Null value for username, password, or fingerprint")
-    service = PyADTPulseAsync(
+    service = create_pulse_service(
         username,
         password,
         fingerprint,
-        service_host=host,
+        host,
         keepalive_interval=keepalive,
         relogin_interval=relogin,
+        supervisor=get_supervisor(hass),
+    )
+
+    timings = _SetupTimings()
+    topology_store = ADTPulseTopologyStore(hass, entry.entry_id)
+    cached_sites = await timings.run("cache", topology_store.async_load_sites())
+    # only creating the entities needs the sites, so import the platforms
+    # while logging in
+    prepare = [timings.run("platforms", _async_load_platforms(hass))]
+    if cached_sites is not None:
+        # create entities from the cached sites now, the manager logs in
+        LOG.debug("%s: starting from cached sites", ADTPULSE_DOMAIN)
+    else:
+        prepare.append(timings.run("login", _async_login(service)))
+    await gather(*prepare)
+    manager = ADTPulseUpdateManager(
+        hass, service, entry, topology_store, cached_sites
+    )
+    manager.set_poll_interval(poll_interval, active_poll_interval)
+    async_migrate_entities(hass, entry, manager.sites)
+    hass.data.setdefault(ADTPULSE_DOMAIN, {})
+    hass.data[ADTPULSE_DOMAIN][entry.entry_id] = manager
+    await timings.run(
+        "entities",
+        hass.config_entries.async_forward_entry_setups(entry, SUPPORTED_PLATFORMS),
     )
+    # entities already have their data, no need to call async_refresh()
+    entry.async_on_unload(entry.add_update_listener(options_listener))
+    await manager.start()
+    timings.log(entry)
+    return True
+
+
+class _SetupTimings:
+    """Durations of the async_setup_entry stages, for debug logging."""
+
+    def __init__(self) -> None:
+        """Start timing setup."""
+        self._start = monotonic()
+        self.stages: dict[str, float] = {}
+
+    async def run(self, stage: str, awaitable: Awaitable[_T]) -> _T:
+        """Await a setup stage, recording how long it took.
+
+        Args:
+            stage (str): stage name
+            awaitable (Awaitable): the stage
+
+        Returns:
+            the result of the stage
+        """
+        start = monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.stages[stage] = monotonic() - start
+
+    def log(self, entry: ConfigEntry) -> None:
+        """Log the total and per stage setup time."""
+        LOG.debug(
+            "%s: set up %s in %.3fs (%s)",
+            ADTPULSE_DOMAIN,
+            entry.title,
+            monotonic() - self._start,
+            ", ".join(f"{stage} {took:.3f}s" for stage, took in self.stages.items()),
+        )
+
+
+async def _async_load_platforms(hass: HomeAssistant) -> None:
+    """Import the platform modules of the integration."""
+    integration = await async_get_integration(hass, ADTPULSE_DOMAIN)
+    await integration.async_get_platforms(SUPPORTED_PLATFORMS)
 
-    hass.data[ADTPULSE_DOMAIN][entry.entry_id] = service
+
+async def _async_login(service: PyADTPulseAsync) -> None:
+    """Log in to ADT Pulse, closing the service if it fails."""
     try:
         await service.async_login()
     except PulseAuthenticationError as ex:
         LOG.error("Unable to connect to ADT Pulse: %s", ex)
+        await async_close_pulse_service(service)
         raise ConfigEntryAuthFailed(
             f"{ADTPULSE_DOMAIN} could not log in due to a protocol error"
         ) from ex
@@ -121,61 +209,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         PulseGatewayOfflineError,
     ) as ex:
         LOG.error("Unable to connect to ADT Pulse: %s", ex)
+        await async_close_pulse_service(service)
         raise ConfigEntryNotReady(
             f"{ADTPULSE_DOMAIN} could not log in due to service unavailability"
         ) from ex
 
-    if service.sites is None:
-        LOG.error("%s could not retrieve any sites", ADTPULSE_DOMAIN)
-        raise ConfigEntryNotReady(f"{ADTPULSE_DOMAIN} could not retrieve any sites")
     try:
-        service.site.gateway.poll_interval = poll_interval
-    except ValueError as ex:
-        LOG.warning(
-            "Could not set poll interval to %f seconds: %s",
-            poll_interval,
-            ex,
-        )
-    coordinator = ADTPulseDataUpdateCoordinator(hass, service)
-    hass.data.setdefault(ADTPULSE_DOMAIN, {})
-    hass.data[ADTPULSE_DOMAIN][entry.entry_id] = coordinator
-    setup_tasks = [
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(entry, platform)
-        )
-        for platform in SUPPORTED_PLATFORMS
-    ]
-    await gather(*setup_tasks)
-    # entities already have their data, no need to call async_refresh()
-    entry.async_on_unload(entry.add_update_listener(options_listener))
-    await coordinator.start()
-    return True
+        service.site
+    except RuntimeError as ex:
+        LOG.error("%s could not retrieve any sites", ADTPULSE_DOMAIN)
+        await async_close_pulse_service(service)
+        raise ConfigEntryNotReady(
+            f"{ADTPULSE_DOMAIN} could not retrieve any sites"
+        ) from ex
 
 
 async def options_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     new_poll = entry.options.get(CONF_SCAN_INTERVAL)
+    new_active_poll = entry.options.get(CONF_ACTIVE_POLL_INTERVAL)
     new_relogin = entry.options.get(CONF_RELOGIN_INTERVAL)
     new_keepalive = entry.options.get(CONF_KEEPALIVE_INTERVAL)
-    coordinator: ADTPulseDataUpdateCoordinator = hass.data[ADTPULSE_DOMAIN][
-        entry.entry_id
-    ]
-    pulse_service = coordinator.adtpulse
+    manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+    pulse_service = manager.adtpulse
 
     if new_poll is not None and new_poll != "":
         LOG.info("Setting new poll interval to %f seconds", new_poll)
     else:
         new_poll = ADT_DEFAULT_POLL_INTERVAL
         LOG.info("Re-setting poll interval to default %f seconds", new_poll)
-    try:
-        pulse_service.site.gateway.poll_interval = new_poll
-        coordinator.async_set_updated_data(None)
-    except ValueError as ex:
-        LOG.warning(
-            "Could not set poll interval to  %f seconds: %s",
-            new_poll,
-            ex,
+    if new_active_poll:
+        LOG.info(
+            "Setting poll interval to %f seconds while armed or active",
+            new_active_poll,
         )
+    manager.set_poll_interval(new_poll, new_active_poll)
+    manager.async_set_updated_data(None)
 
     if new_relogin is None or new_relogin == "":
         new_relogin = ADT_DEFAULT_RELOGIN_INTERVAL
@@ -217,11 +286,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     if unload_ok:
-        coordinator: ADTPulseDataUpdateCoordinator = hass.data[ADTPULSE_DOMAIN][
-            entry.entry_id
-        ]
-        await coordinator.stop()
-        await coordinator.adtpulse.async_logout()
+        manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+        await manager.stop()
+        if manager.logged_in:
+            await manager.adtpulse.async_logout()
+        await async_close_pulse_service(manager.adtpulse)
         hass.data[ADTPULSE_DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached sites of a deleted config entry."""
+    await ADTPulseTopologyStore(hass, entry.entry_id).async_remove()
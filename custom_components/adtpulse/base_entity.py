@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from logging import getLogger
-from typing import Any, Mapping
+from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from pyadtpulse.alarm_panel import ADTPulseAlarmPanel
+from pyadtpulse.gateway import ADTPulseGateway
 from pyadtpulse.pyadtpulse_async import PyADTPulseAsync
+from pyadtpulse.site import ADTPulseSite
 
 from .const import ADTPULSE_DATA_ATTRIBUTION
 from .coordinator import ADTPulseDataUpdateCoordinator
@@ -16,58 +19,110 @@ LOG = getLogger(__name__)
 
 
 class ADTPulseEntity(CoordinatorEntity[ADTPulseDataUpdateCoordinator]):
-    """Base Entity class for ADT Pulse devices."""
-
-    def __init__(self, coordinator: ADTPulseDataUpdateCoordinator, name: str):
+    """Base Entity class for ADT Pulse devices.
+
+    Subclasses set their static _attr_* values in __init__ and the ones
+    derived from Pulse data in _update_attrs(), which runs on every
+    coordinator update, so nothing is recomputed when Home Assistant reads
+    them.
+    """
+
+    _attr_attribution = ADTPULSE_DATA_ATTRIBUTION
+    _attr_has_entity_name = True
+    # should generally be None since using has_entity_name
+    _attr_name = None
+    # whether writes count towards the coordinator's write metrics
+    _count_writes = True
+
+    def __init__(
+        self,
+        coordinator: ADTPulseDataUpdateCoordinator,
+        name: str,
+        context: Any = None,
+    ):
         """Initialize an ADTPulse entity.
 
         Args:
             coordinator (ADTPulseDataUpdateCoordinator): update coordinator to use
             name (str): entity name
+            context (Any): coordinator listener context, defaults to name
         """
         self._name = name
         # save references to commonly used objects
         self._pulse_connection: PyADTPulseAsync = coordinator.adtpulse
-        self._site = self._pulse_connection.site
-        self._gateway = self._site.gateway
-        self._alarm = self._site.alarm_control_panel
-        self._attrs: dict = {}
-        super().__init__(coordinator, name)
+        self._state_fingerprint: tuple | None = None
+        super().__init__(coordinator, name if context is None else context)
 
-    # Base level properties that can be overridden by subclasses
+    # the coordinator's site is replaced when a site restored from cache goes live
     @property
-    def name(self) -> str | None:
-        """Return the display name for this sensor.
-
-        Should generally be none since using has_entity_name."""
-        return None
+    def _site(self) -> ADTPulseSite:
+        return self.coordinator.site
 
     @property
-    def has_entity_name(self) -> bool:
-        """Returns has_entity_name.  Should generally be true."""
-        return True
+    def _gateway(self) -> ADTPulseGateway:
+        return self.coordinator.site.gateway
 
     @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return the device state attributes."""
-        return self._attrs
+    def _alarm(self) -> ADTPulseAlarmPanel:
+        return self.coordinator.site.alarm_control_panel
 
     @property
     def available(self) -> bool:
         """Returns whether an entity is available.
 
-        Generally false if gateway is offline or there was an exception
+        Generally false if gateway is offline or there was an exception, and
+        until the site restored from cache has gone live
         """
-        return self._gateway.is_online and self.coordinator.last_exception is None
+        return (
+            self.coordinator.site_is_live
+            and self._gateway.is_online
+            and self.coordinator.last_exception is None
+        )
 
-    @property
-    def attribution(self) -> str:
-        """Return API data attribution."""
-        return ADTPULSE_DATA_ATTRIBUTION
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the _attr_* values derived from Pulse data.
+
+        Attribute dicts must be replaced rather than changed in place, since
+        the last written ones are kept to detect redundant writes.
+        """
+
+    def _get_state_fingerprint(self) -> tuple:
+        """Return the rendered state, compared to detect redundant writes.
+
+        Subclasses displaying other changing data should extend this.
+        """
+        return (
+            self.available,
+            self.state,
+            self.icon,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, forgetting the fingerprint of the last update."""
+        # the next coordinator update always writes after a direct write
+        self._state_fingerprint = None
+        super().async_write_ha_state()
+
+    @callback
+    def _record_skipped_write(self) -> None:
+        """Count an update that didn't write because nothing changed."""
+        if self._count_writes:
+            self.coordinator.skipped_writes += 1
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Call update method."""
+        """Write the state if it changed since the last coordinator update."""
+        self._update_attrs()
+        fingerprint = self._get_state_fingerprint()
+        if fingerprint == self._state_fingerprint:
+            self._record_skipped_write()
+            return
         LOG.debug("Scheduling update ADT Pulse entity %s", self._name)
         # inform HASS that ADT Pulse data for this entity has been updated
         self.async_write_ha_state()
+        self._state_fingerprint = fingerprint
+        if self._count_writes:
+            self.coordinator.performed_writes += 1
@@ -10,32 +10,46 @@ from __future__ import annotations
 
 from logging import getLogger
 from datetime import datetime
-from typing import Any, Mapping
+from sys import intern
+from time import monotonic
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import as_local
+from homeassistant.helpers.event import async_call_later
 from pyadtpulse.site import ADTPulseSite
 from pyadtpulse.zones import ADTPulseZoneData
 
 from .base_entity import ADTPulseEntity
-from .const import ADTPULSE_DOMAIN
+from .const import (
+    ADTPULSE_DOMAIN,
+    CONF_MOTION_HOLD_TIME,
+    CONF_TROUBLE_DELAY,
+    DEFAULT_MOTION_HOLD_TIME,
+    DEFAULT_TROUBLE_DELAY,
+)
 from .coordinator import (
     ADTPulseDataUpdateCoordinator,
+    ADTPulseUpdateManager,
+    ARM_READINESS_CONTEXT,
+    GATEWAY_CONTEXT,
     ZONE_CONTEXT_PREFIX,
     ZONE_TROUBLE_PREFIX,
+    ZoneField,
+    ZoneListenerContext,
 )
 from .utils import (
+    get_alarm_device_info,
     get_alarm_unique_id,
     get_gateway_unique_id,
-    migrate_entity_name,
+    get_site_zones,
+    LocalTimestampCache,
     zone_is_in_trouble,
     zone_is_open,
 )
@@ -54,39 +68,181 @@ ADT_DEVICE_CLASS_TAG_MAP = {
     "glass": BinarySensorDeviceClass.SOUND,
 }
 
+# zones whose changes are always reported right away
+LIFE_SAFETY_DEVICE_CLASSES = {
+    BinarySensorDeviceClass.CO,
+    BinarySensorDeviceClass.HEAT,
+    BinarySensorDeviceClass.MOISTURE,
+    BinarySensorDeviceClass.SMOKE,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up sensors for an ADT Pulse installation."""
-    coordinator: ADTPulseDataUpdateCoordinator = hass.data[ADTPULSE_DOMAIN][
-        entry.entry_id
-    ]
-    site = coordinator.adtpulse.site
-    migrate_entity_name(hass, site, "binary_sensor", get_gateway_unique_id(site))
-    async_add_entities([ADTPulseGatewaySensor(coordinator, site)])
-    if not site.zones_as_dict:
+    manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+    # the entry is reloaded when options change
+    motion_hold_time = entry.options.get(
+        CONF_MOTION_HOLD_TIME, DEFAULT_MOTION_HOLD_TIME
+    )
+    trouble_delay = entry.options.get(CONF_TROUBLE_DELAY, DEFAULT_TROUBLE_DELAY)
+    for coordinator in manager.coordinators.values():
+        _async_setup_site(
+            coordinator, async_add_entities, motion_hold_time, trouble_delay
+        )
+
+
+def _async_setup_site(
+    coordinator: ADTPulseDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    motion_hold_time: float,
+    trouble_delay: float,
+) -> None:
+    """Set up the gateway and zone sensors of a single site."""
+    site = coordinator.site
+    async_add_entities(
+        [
+            ADTPulseGatewaySensor(coordinator, site),
+            ADTPulseArmReadinessSensor(coordinator, site),
+        ]
+    )
+    if not get_site_zones(site):
         LOG.error(
             "ADT's Pulse service returned NO zones (sensors) for site %s:", site.id
         )
         return
-    entities = [
-        ADTPulseZoneSensor(coordinator, site, zone_id, trouble_indicator)
-        for zone_id in site.zones_as_dict.keys()
-        for trouble_indicator in (True, False)
-    ]
+    entities: list[ADTPulseZoneSensor] = []
+    zones = compile_zone_descriptors(site)
+    coordinator.zone_device_classes = {
+        zone.zone_id: zone.device_class for zone in zones
+    }
+    for zone in zones:
+        entities.append(
+            ADTPulseZoneSensor(coordinator, zone, True, trouble_delay=trouble_delay)
+        )
+        if zone.device_class is not None:
+            entities.append(
+                ADTPulseZoneSensor(
+                    coordinator, zone, False, motion_hold_time=motion_hold_time
+                )
+            )
+    async_add_entities(entities)
+
 
-    _ = (
-        migrate_entity_name(
-            hass,
-            site,
-            "binary_sensor",
-            entity.unique_id,
+def _determine_device_class(
+    zone_data: ADTPulseZoneData,
+) -> BinarySensorDeviceClass | None:
+    """Map the ADT Pulse device type tag of a zone to a binary sensor class.
+
+    This gets the proper status codes and icons displayed.
+
+    Returns:
+        BinarySensorDeviceClass | None: the device class, None if unsupported
+    """
+    tags = zone_data.tags
+    device_class: BinarySensorDeviceClass | None = None
+    if "sensor" in tags:
+        for tag in tags:
+            device_class = ADT_DEVICE_CLASS_TAG_MAP.get(tag)
+            if device_class is not None:
+                break
+    if device_class is None:
+        LOG.warning(
+            "Ignoring unsupported sensor type from ADT Pulse cloud "
+            "service, configured tags: %s",
+            tags,
         )
-        for entity in entities
+        return None
+    # since ADT Pulse does not separate the concept of a door or window sensor,
+    # we try to autodetect window type sensors so the appropriate icon is displayed
+    if device_class == BinarySensorDeviceClass.DOOR:
+        if "Window" in zone_data.name or "window" in zone_data.name:
+            device_class = BinarySensorDeviceClass.WINDOW
+    LOG.debug(
+        "Determined %s device class %s from ADT Pulse service configured tags %s",
+        zone_data.name,
+        device_class,
+        tags,
+    )
+    return device_class
+
+
+class ZoneDescriptor:
+    """What the sensors of a zone need to know that doesn't change.
+
+    Compiled once per site when its entities are created, which happens again
+    whenever zones are added or removed, and shared by the zone's state and
+    trouble sensors.
+    """
+
+    __slots__ = (
+        "zone_id",
+        "name",
+        "device_class",
+        "life_safety",
+        "unique_id",
+        "trouble_unique_id",
+        "listener_context",
+        "trouble_listener_context",
+        "device_info",
     )
 
-    async_add_entities(entities)
+    def __init__(
+        self,
+        site: ADTPulseSite,
+        zone_id: int,
+        zone_data: ADTPulseZoneData,
+        via_device: str,
+    ):
+        """Compile the descriptor of a zone.
+
+        Args:
+            site (ADTPulseSite): site of the zone
+            zone_id (int): zone id
+            zone_data (ADTPulseZoneData): the zone
+            via_device (str): unique id of the alarm panel device
+        """
+        self.zone_id = zone_id
+        self.name = zone_data.name
+        self.device_class = _determine_device_class(zone_data)
+        self.life_safety = any(
+            ADT_DEVICE_CLASS_TAG_MAP.get(tag) in LIFE_SAFETY_DEVICE_CLASSES
+            for tag in zone_data.tags
+        )
+        self.unique_id = f"adt_pulse_sensor_{site.id}_{zone_data.id_}"
+        self.trouble_unique_id = f"adt_pulse_trouble_sensor_{site.id}_{zone_data.id_}"
+        context = intern(ZONE_CONTEXT_PREFIX + str(zone_id))
+        self.listener_context = ZoneListenerContext(
+            self.zone_id, ZoneField.ALL, context
+        )
+        self.trouble_listener_context = ZoneListenerContext(
+            self.zone_id,
+            ZoneField.STATE | ZoneField.STATUS,
+            intern(context + ZONE_TROUBLE_PREFIX),
+        )
+        self.device_info = DeviceInfo(
+            identifiers={(ADTPULSE_DOMAIN, f"{site.id}-{self.name}")},
+            via_device=(ADTPULSE_DOMAIN, via_device),
+            name=self.name,
+            manufacturer="ADT",
+        )
+
+
+def compile_zone_descriptors(site: ADTPulseSite) -> list[ZoneDescriptor]:
+    """Compile the descriptors of every zone of a site.
+
+    Args:
+        site (ADTPulseSite): the site
+
+    Returns:
+        list[ZoneDescriptor]: the descriptors in zone order
+    """
+    via_device = get_alarm_unique_id(site)
+    return [
+        ZoneDescriptor(site, zone_id, zone_data, via_device)
+        for zone_id, zone_data in get_site_zones(site).items()
+    ]
 
 
 class ADTPulseZoneSensor(ADTPulseEntity, BinarySensorEntity):
@@ -95,154 +251,181 @@ class ADTPulseZoneSensor(ADTPulseEntity, BinarySensorEntity):
     # zone = {'id': 'sensor-12', 'name': 'South Office Motion',
     # 'tags': ['sensor', 'motion'], 'status': 'Motion', 'activityTs': 1569078085275}
 
-    @staticmethod
-    def _get_my_zone(site: ADTPulseSite, zone_id: int) -> ADTPulseZoneData:
-        if site.zones_as_dict is None:
-            raise RuntimeError("ADT pulse returned null zone")
-        return site.zones_as_dict[zone_id]
-
-    @staticmethod
-    def _determine_device_class(zone_data: ADTPulseZoneData) -> BinarySensorDeviceClass:
-        # map the ADT Pulse device type tag to a binary_sensor class
-        # so the proper status codes and icons are displayed. If device class
-        # is not specified, binary_sensor defaults to a generic on/off sensor
-
-        tags = zone_data.tags
-        device_class: BinarySensorDeviceClass | None = None
-
-        if "sensor" in tags:
-            for tag in tags:
-                try:
-                    device_class = ADT_DEVICE_CLASS_TAG_MAP[tag]
-                    break
-                except KeyError:
-                    continue
-        # since ADT Pulse does not separate the concept of a door or window sensor,
-        # we try to autodetect window type sensors so the appropriate icon is displayed
-        if device_class is None:
-            LOG.warning(
-                "Ignoring unsupported sensor type from ADT Pulse cloud "
-                "service, configured tags: %s",
-                tags,
-            )
-            raise ValueError(f"Unknown ADT Pulse device class {device_class}")
-        if device_class == BinarySensorDeviceClass.DOOR:
-            if "Window" in zone_data.name or "window" in zone_data.name:
-                device_class = BinarySensorDeviceClass.WINDOW
-        LOG.info(
-            "Determined %s device class %sfrom ADT Pulse service configured tags %s",
-            zone_data.name,
-            device_class,
-            tags,
-        )
-        return device_class
+    # changes with every zone event, the state's last_changed already has it
+    _unrecorded_attributes = frozenset({"last_activity_timestamp"})
 
     def __init__(
         self,
         coordinator: ADTPulseDataUpdateCoordinator,
-        site: ADTPulseSite,
-        zone_id: int,
+        zone: ZoneDescriptor,
         trouble_indicator: bool,
+        motion_hold_time: float = 0,
+        trouble_delay: float = 0,
     ):
-        """Initialize the binary_sensor."""
-        sensor_type = ""
-        if trouble_indicator:
-            sensor_type = "trouble"
-        LOG.debug(
-            "%s: adding zone %s sensor for site %s, zone %d",
-            ADTPULSE_DOMAIN,
-            sensor_type,
-            site.id,
-            zone_id,
-        )
-        self._zone_id = zone_id
+        """Initialize the binary_sensor.
+
+        Args:
+            coordinator (ADTPulseDataUpdateCoordinator):
+                HASS data update coordinator
+            zone (ZoneDescriptor): descriptor of the zone
+            trouble_indicator (bool): show the zone's trouble instead of its state
+            motion_hold_time (float): seconds motion sensors stay on after
+                motion ends
+            trouble_delay (float): seconds trouble has to last before it's shown
+        """
+        self._zone = zone
         self._is_trouble_indicator = trouble_indicator
-        self._my_zone = self._get_my_zone(site, zone_id)
-        self._zone_context = ZONE_CONTEXT_PREFIX + str(self._zone_id)
+        self._my_zone = self._get_my_zone(coordinator.site, zone.zone_id)
+        # when the zone started differing from the shown state, and the timer
+        # to show it once the hold time is over
+        self._held_since: float | None = None
+        self._cancel_hold_timer: CALLBACK_TYPE | None = None
+        self._last_activity: LocalTimestampCache | None = None
+        # seconds a change to on, and to off, has to last before it's shown
+        self._hold_on_time = 0.0
+        self._hold_off_time = 0.0
+        if not zone.life_safety:
+            if trouble_indicator:
+                self._hold_on_time = float(trouble_delay)
+            elif zone.device_class == BinarySensorDeviceClass.MOTION:
+                self._hold_off_time = float(motion_hold_time)
         if trouble_indicator:
-            self._device_class = BinarySensorDeviceClass.PROBLEM
-            self._zone_context += ZONE_TROUBLE_PREFIX
+            self._attr_device_class = BinarySensorDeviceClass.PROBLEM
+            self._attr_name = "Trouble"
+            self._attr_unique_id = zone.trouble_unique_id
+            listener_context = zone.trouble_listener_context
         else:
-            self._device_class = self._determine_device_class(self._my_zone)
-            self._name = f"{self._my_zone.name}"
-        super().__init__(coordinator, self._zone_context)
+            self._attr_device_class = zone.device_class
+            self._attr_unique_id = zone.unique_id
+            self._last_activity = LocalTimestampCache()
+            listener_context = zone.listener_context
+        self._attr_device_info = zone.device_info
+        super().__init__(coordinator, listener_context.name, listener_context)
+        self._update_attrs()
         LOG.debug(
-            "Created ADT Pulse '%s' sensor %s - %s",
-            self._device_class,
-            self._zone_context,
-            self._my_zone.name,
+            "%s: created zone sensor %s for site %s",
+            ADTPULSE_DOMAIN,
+            self._name,
+            coordinator.site.id,
         )
 
-    @property
-    def name(self) -> str | None:
-        """Return the name of the zone."""
-        if self._is_trouble_indicator:
-            return "Trouble"
-        return None
+    @staticmethod
+    def _get_my_zone(site: ADTPulseSite, zone_id: int) -> ADTPulseZoneData:
+        return get_site_zones(site)[zone_id]
 
-    @property
-    def unique_id(self) -> str:
-        """Return HA unique id."""
-        if self._is_trouble_indicator:
-            return f"adt_pulse_trouble_sensor_{self._site.id}_{self._my_zone.id_}"
-        return f"adt_pulse_sensor_{self._site.id}_{self._my_zone.id_}"
+    @callback
+    def _update_attrs(self) -> None:
+        """Update sensor state and attributes.
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if the binary sensor is on."""
+        currently status and last_activity_timestamp, or the trouble type
+        """
+        zones = get_site_zones(self._site)
+        if self._zone.zone_id in zones:
+            self._my_zone = zones[self._zone.zone_id]
         # sensor is considered tripped if the state is anything but OK
         if self._is_trouble_indicator:
-            return zone_is_in_trouble(self._my_zone)
-        return zone_is_open(self._my_zone)
+            self._attr_is_on = self._apply_hold_time(
+                zone_is_in_trouble(self._my_zone)
+            )
+        else:
+            self._attr_is_on = self._apply_hold_time(zone_is_open(self._my_zone))
+        # keep showing the attributes of the held state, so the write is skipped
+        if self._held_since is not None:
+            return
+        if self._is_trouble_indicator:
+            self._attr_extra_state_attributes = {
+                "trouble_type": self._my_zone.state if self._attr_is_on else None
+            }
+        else:
+            assert self._last_activity is not None
+            self._attr_extra_state_attributes = {
+                "status": self._my_zone.status,
+                "last_activity_timestamp": self._last_activity.convert(
+                    self._my_zone.last_activity_timestamp
+                ),
+            }
+        LOG.debug(
+            "Setting ADT Pulse %s - %s to %s at timestamp %d",
+            self._name,
+            self._my_zone.name,
+            "on" if self._attr_is_on else "off",
+            self._my_zone.last_activity_timestamp,
+        )
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass:
-        """Return the class of the binary sensor."""
-        return self._device_class
+    def _get_hold_time(self, is_on: bool) -> float:
+        """Return seconds a change to is_on has to last before it's shown."""
+        return self._hold_on_time if is_on else self._hold_off_time
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return extra state attributes.
+    @callback
+    def _apply_hold_time(self, is_on: bool) -> bool | None:
+        """Return the is_on to show, holding back changes during their hold time.
+
+        Motion sensors stay on for a while after motion ends, and trouble has
+        to last a while before it's shown, so busy or flapping zones don't
+        write a state on every change.
+
+        Args:
+            is_on (bool): the zone's current is_on
 
-        currently status and last_activity_timestamp
+        Returns:
+            bool | None: is_on to show
         """
-        if self._is_trouble_indicator:
-            if self.is_on:
-                return {"trouble_type": self._my_zone.state}
-            else:
-                return {"trouble_type": None}
-        return {
-            "status": self._my_zone.status,
-            "last_activity_timestamp": as_local(
-                datetime.fromtimestamp(self._my_zone.last_activity_timestamp)
-            ),
-        }
+        shown = self._attr_is_on
+        if shown is None or is_on == shown:
+            self._cancel_hold()
+            return is_on
+        now = monotonic()
+        if self._held_since is None:
+            self._held_since = now
+        remaining = self._get_hold_time(is_on) - (now - self._held_since)
+        if remaining <= 0:
+            self._cancel_hold()
+            return is_on
+        if self._cancel_hold_timer is None:
+            self._cancel_hold_timer = async_call_later(
+                self.hass, remaining, self._async_hold_time_over
+            )
+        return shown
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(ADTPULSE_DOMAIN, f"{self._site.id}-{self._my_zone.name}")},
-            via_device=(ADTPULSE_DOMAIN, get_alarm_unique_id(self._site)),
-            name=self._my_zone.name,
-            manufacturer="ADT",
-        )
+    @callback
+    def _record_skipped_write(self) -> None:
+        if self._held_since is not None:
+            self.coordinator.suppressed_writes += 1
+        else:
+            super()._record_skipped_write()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        LOG.debug(
-            "Setting ADT Pulse %s - %s to %s at timestamp %d",
-            self._zone_context,
-            self._my_zone.name,
-            "on" if self.is_on else "off",
-            self._my_zone.last_activity_timestamp,
-        )
-        self.async_write_ha_state()
+    def _cancel_hold(self) -> None:
+        self._held_since = None
+        if self._cancel_hold_timer is not None:
+            self._cancel_hold_timer()
+            self._cancel_hold_timer = None
+
+    @callback
+    def _async_hold_time_over(self, _now: datetime) -> None:
+        self._cancel_hold_timer = None
+        self._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the hold timer."""
+        self._cancel_hold()
+        await super().async_will_remove_from_hass()
 
 
 class ADTPulseGatewaySensor(ADTPulseEntity, BinarySensorEntity):
     """HASS Gateway Online Binary Sensor."""
 
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    # change on every update, recording them stores a new attribute row each time
+    _unrecorded_attributes = frozenset(
+        {
+            "current_poll_interval",
+            "initial_poll_interval",
+            "next_update",
+            "last_update",
+        }
+    )
+
     def __init__(self, coordinator: ADTPulseDataUpdateCoordinator, site: ADTPulseSite):
         """Initialize gateway sensor.
 
@@ -254,39 +437,14 @@ class ADTPulseGatewaySensor(ADTPulseEntity, BinarySensorEntity):
         LOG.debug(
             "%s: adding gateway status sensor for site %s", ADTPULSE_DOMAIN, site.name
         )
-        self._device_class = BinarySensorDeviceClass.CONNECTIVITY
-        super().__init__(coordinator, "Gateway")
-
-    @property
-    def is_on(self) -> bool:
-        """Return if gateway is online."""
-        return self._gateway.is_online
-
-    @property
-    def unique_id(self) -> str:
-        """Return HA unique id."""
-        return get_gateway_unique_id(self._site)
-
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any]:
-        """Return the device state attributes."""
-        return {
-            "primary_connection_type": self._gateway.primary_connection_type,
-            "broadband_connection_status": self._gateway.broadband_connection_status,
-            "cellular_connection_status": self._gateway.cellular_connection_status,
-            "signal_strength": self._gateway.cellular_connection_signal_strength,
-            "broadband_lan_ip_address": str(self._gateway.broadband_lan_ip_address),
-            "device_lan_ip_address": str(self._gateway.device_lan_ip_address),
-            "router_lan_ip_address": str(self._gateway.router_lan_ip_address),
-            "router_wan_ip_address": str(self._gateway.router_wan_ip_address),
-            "current_poll_interval": self._gateway.backoff.get_current_backoff_interval(),
-            "initial_poll_interval": self._gateway.backoff.initial_backoff_interval,
-            "next_update": as_local(datetime.fromtimestamp(self._gateway.next_update)),
-            "last_update": as_local(datetime.fromtimestamp(self._gateway.last_update)),
-        }
-
-    @property
-    def device_info(self) -> DeviceInfo:
+        super().__init__(coordinator, GATEWAY_CONTEXT)
+        self._attr_unique_id = get_gateway_unique_id(site)
+        self._attr_device_info = self._get_device_info()
+        self._next_update = LocalTimestampCache()
+        self._last_update = LocalTimestampCache()
+        self._update_attrs()
+
+    def _get_device_info(self) -> DeviceInfo:
         mac_addresses = set()
         for i in ("broadband_lan_mac", "device_lan_mac"):
             if getattr(self._gateway, i) is not None:
@@ -308,8 +466,61 @@ class ADTPulseGatewaySensor(ADTPulseEntity, BinarySensorEntity):
         return di
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        LOG.debug("Setting Pulse Gateway online status to %s", self._gateway.is_online)
-        LOG.debug("Gateway attributes: %s", self.extra_state_attributes)
+    def _update_attrs(self) -> None:
+        """Update gateway online status and the device state attributes."""
+        self._attr_is_on = self._gateway.is_online
+        self._attr_extra_state_attributes = {
+            "primary_connection_type": self._gateway.primary_connection_type,
+            "broadband_connection_status": self._gateway.broadband_connection_status,
+            "cellular_connection_status": self._gateway.cellular_connection_status,
+            "signal_strength": self._gateway.cellular_connection_signal_strength,
+            "broadband_lan_ip_address": str(self._gateway.broadband_lan_ip_address),
+            "device_lan_ip_address": str(self._gateway.device_lan_ip_address),
+            "router_lan_ip_address": str(self._gateway.router_lan_ip_address),
+            "router_wan_ip_address": str(self._gateway.router_wan_ip_address),
+            "current_poll_interval": self._gateway.backoff.get_current_backoff_interval(),
+            "initial_poll_interval": self._gateway.backoff.initial_backoff_interval,
+            "next_update": self._next_update.convert(self._gateway.next_update),
+            "last_update": self._last_update.convert(self._gateway.last_update),
+        }
+        LOG.debug("Setting Pulse Gateway online status to %s", self._attr_is_on)
+        LOG.debug("Gateway attributes: %s", self._attr_extra_state_attributes)
         LOG.debug("Gateway state: %s", self._gateway)
-        self.async_write_ha_state()
+
+
+class ADTPulseArmReadinessSensor(ADTPulseEntity, BinarySensorEntity):
+    """HASS sensor showing if the system can be armed without forcing it."""
+
+    _attr_name = "Ready to arm"
+
+    def __init__(self, coordinator: ADTPulseDataUpdateCoordinator, site: ADTPulseSite):
+        """Initialize ready to arm sensor.
+
+        Args:
+            coordinator (ADTPulseDataUpdateCoordinator):
+                HASS data update coordinator
+            site (ADTPulseSite): site the sensor belongs to
+        """
+        LOG.debug(
+            "%s: adding ready to arm sensor for site %s", ADTPULSE_DOMAIN, site.id
+        )
+        super().__init__(coordinator, ARM_READINESS_CONTEXT)
+        self._attr_unique_id = f"adt_pulse_ready_to_arm_{site.id}"
+        self._attr_device_info = get_alarm_device_info(site)
+        self._update_attrs()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update readiness and the names of the zones blocking arming."""
+        arm_readiness = self.coordinator.arm_readiness
+        self._attr_is_on = arm_readiness.can_arm
+        self._attr_icon = "mdi:shield-check" if self._attr_is_on else "mdi:shield-alert"
+        self._attr_extra_state_attributes = {
+            "open_zones": arm_readiness.zone_names(arm_readiness.open_zones),
+            "trouble_zones": arm_readiness.zone_names(arm_readiness.trouble_zones),
+        }
+        LOG.debug(
+            "Setting ADT Pulse site %s ready to arm to %s",
+            self._site.id,
+            self._attr_is_on,
+        )
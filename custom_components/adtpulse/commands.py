@@ -0,0 +1,161 @@
+"""Alarm command queue for ADT Pulse sites."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from asyncio import CancelledError, Future, get_running_loop, shield, timeout
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import ADTPULSE_DOMAIN
+from .metrics import ALARM_COMMAND_BUCKETS, Histogram
+
+LOG = getLogger(__name__)
+
+# seconds to wait for Pulse to report the new alarm status, pyadtpulse alone
+# holds the arming/disarming status for up to 20 seconds
+COMMAND_CONFIRM_TIMEOUT = 60
+# latencies kept per command
+LATENCY_SAMPLES = 100
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmCommand:
+    """An alarm status change requested from Home Assistant."""
+
+    status: str
+    force: bool = False
+
+    def __str__(self) -> str:
+        """Return the command as text."""
+        return f"force {self.status}" if self.force else self.status
+
+
+class ADTPulseAlarmCommandQueue:
+    """Run the alarm commands of a site one at a time.
+
+    A command is only complete once Pulse reports the new alarm status, not
+    when the arm/disarm request returns.  While a command is pending the same
+    command waits for it instead of being sent again, and any other command
+    is rejected, so whichever command came first wins.
+    """
+
+    def __init__(self, confirm_timeout: float = COMMAND_CONFIRM_TIMEOUT):
+        """Initialize the queue.
+
+        Args:
+            confirm_timeout (float): seconds to wait for Pulse to report the
+                new alarm status
+        """
+        self._confirm_timeout = confirm_timeout
+        self._pending: AlarmCommand | None = None
+        self._future: Future[None] | None = None
+        # latest latencies and all time histogram by command
+        self.latencies: dict[str, deque[float]] = {}
+        self.latency_seconds: dict[str, Histogram] = {}
+
+    @property
+    def pending(self) -> AlarmCommand | None:
+        """Return the command in progress, if any."""
+        return self._pending
+
+    async def async_run(
+        self,
+        command: AlarmCommand,
+        send: Callable[[], Awaitable[bool]],
+        confirm: bool = True,
+    ) -> None:
+        """Run a command, or wait for the same command already in progress.
+
+        Args:
+            command (AlarmCommand): the command
+            send (Callable[[], Awaitable[bool]]): sends the command to Pulse,
+                returning whether it was accepted
+            confirm (bool): wait for Pulse to report the new alarm status
+
+        Raises:
+            HomeAssistantError: if a different command is in progress, or the
+                command failed or wasn't confirmed in time
+        """
+        if self._pending is not None:
+            if command != self._pending:
+                raise HomeAssistantError(
+                    f"Cannot set alarm to {command} while setting it to "
+                    f"{self._pending}"
+                )
+            assert self._future is not None
+            LOG.debug("%s: waiting for pending alarm %s", ADTPULSE_DOMAIN, command)
+            await shield(self._future)
+            return
+        future: Future[None] = get_running_loop().create_future()
+        self._pending = command
+        self._future = future
+        start = perf_counter()
+        try:
+            if not await send():
+                raise HomeAssistantError(f"Could not set alarm status to {command}")
+            if confirm:
+                async with timeout(self._confirm_timeout):
+                    await shield(future)
+        except TimeoutError as ex:
+            err = HomeAssistantError(
+                f"Pulse did not report alarm status {command.status} within "
+                f"{self._confirm_timeout} seconds"
+            )
+            self._fail(future, err)
+            raise err from ex
+        except BaseException as ex:
+            self._fail(future, ex)
+            raise
+        else:
+            if not future.done():
+                future.set_result(None)
+            self._record_latency(command, perf_counter() - start)
+        finally:
+            if self._future is future:
+                self._pending = None
+                self._future = None
+
+    @callback
+    def async_observe_status(self, status: str) -> None:
+        """Complete the pending command if Pulse reports its alarm status.
+
+        Args:
+            status (str): alarm status reported by Pulse
+        """
+        if (
+            self._pending is not None
+            and self._pending.status == status
+            and self._future is not None
+            and not self._future.done()
+        ):
+            self._future.set_result(None)
+            # done now, so the coordinator's listeners see no pending command
+            self._pending = None
+            self._future = None
+
+    @staticmethod
+    def _fail(future: Future[None], ex: BaseException) -> None:
+        if future.done():
+            return
+        if isinstance(ex, CancelledError):
+            future.cancel()
+            return
+        future.set_exception(ex)
+        # retrieved by anyone waiting for the same command, don't log it
+        future.exception()
+
+    def _record_latency(self, command: AlarmCommand, latency: float) -> None:
+        LOG.info(
+            "%s: alarm %s completed in %.2f seconds", ADTPULSE_DOMAIN, command, latency
+        )
+        name = str(command)
+        self.latencies.setdefault(name, deque(maxlen=LATENCY_SAMPLES)).append(latency)
+        if name not in self.latency_seconds:
+            self.latency_seconds[name] = Histogram(ALARM_COMMAND_BUCKETS)
+        self.latency_seconds[name].observe(latency)
@@ -39,11 +39,19 @@ from pyadtpulse.site import ADTPulseSite
 
 from .const import (
     ADTPULSE_DOMAIN,
+    CONF_ACTIVE_POLL_INTERVAL,
     CONF_FINGERPRINT,
     CONF_HOSTNAME,
     CONF_KEEPALIVE_INTERVAL,
+    CONF_MOTION_HOLD_TIME,
     CONF_RELOGIN_INTERVAL,
+    CONF_TROUBLE_DELAY,
+    DEFAULT_ACTIVE_POLL_INTERVAL,
+    DEFAULT_MOTION_HOLD_TIME,
+    DEFAULT_TROUBLE_DELAY,
+    ENTITY_MIGRATION_VERSION,
 )
+from .coordinator import ADTPulseUpdateManager
 
 LOG = getLogger(__name__)
 
@@ -115,6 +123,8 @@ class PulseConfigFlow(ConfigFlow, domain=ADTPULSE_DOMAIN):  # type: ignore
         return PulseOptionsFlowHandler(config_entry)
 
     VERSION = 1
+    # new entries don't have old entity names to migrate
+    MINOR_VERSION = ENTITY_MIGRATION_VERSION
     CONNECTION_CLASS = CONN_CLASS_CLOUD_PUSH
 
     _reauth_entry: ConfigEntry | None = None
@@ -138,9 +148,15 @@ class PulseConfigFlow(ConfigFlow, domain=ADTPULSE_DOMAIN):  # type: ignore
         # actually create the HA config entry. Note the "title" value is returned by
         # `validate_input` above.
         errors = info = {}
+        reauthenticated = False
         if user_input is not None:
             try:
-                info = await self.validate_input(user_input)
+                if self._reauth_entry is not None:
+                    reauthenticated = await self._async_reauth_in_place(user_input)
+                if reauthenticated:
+                    info = {"title": self._reauth_entry.title}
+                else:
+                    info = await self.validate_input(user_input)
             except PulseAuthenticationError:
                 errors["base"] = "invalid_auth"
             except PulseMFARequiredError:
@@ -166,7 +182,10 @@ class PulseConfigFlow(ConfigFlow, domain=ADTPULSE_DOMAIN):  # type: ignore
                 self.hass.config_entries.async_update_entry(
                     self._reauth_entry, title=info["title"], data=user_input
                 )
-                await self.hass.config_entries.async_reload(self._reauth_entry.entry_id)
+                if not reauthenticated:
+                    await self.hass.config_entries.async_reload(
+                        self._reauth_entry.entry_id
+                    )
                 return self.async_abort(reason="reauth_successful")
 
         # If there is no user input or there were errors, show the form again,
@@ -177,6 +196,39 @@ class PulseConfigFlow(ConfigFlow, domain=ADTPULSE_DOMAIN):  # type: ignore
             step_id="user", data_schema=self._get_data_schema(user_input), errors=errors
         )
 
+    async def _async_reauth_in_place(self, user_input: dict[str, Any]) -> bool:
+        """Log the running entry in with the new credentials.
+
+        Reloading would recreate every entity and log in again, so the
+        password and fingerprint are swapped on the running service instead.
+        A different account or host could have other sites, so those still
+        reload, as does an entry that isn't running.
+
+        Args:
+            user_input (dict[str, Any]): the new config entry data
+
+        Returns:
+            bool: True if logged in, False if the entry needs reloading
+
+        Raises:
+            the exceptions of ADTPulseUpdateManager.async_reauthenticate()
+        """
+        assert self._reauth_entry is not None
+        entry = self._reauth_entry
+        manager: ADTPulseUpdateManager | None = self.hass.data.get(
+            ADTPULSE_DOMAIN, {}
+        ).get(entry.entry_id)
+        if (
+            manager is None
+            or entry.data.get(CONF_USERNAME) != user_input[CONF_USERNAME]
+            or entry.data.get(CONF_HOSTNAME) != user_input[CONF_HOSTNAME]
+        ):
+            return False
+        await manager.async_reauthenticate(
+            user_input[CONF_PASSWORD], user_input[CONF_FINGERPRINT]
+        )
+        return True
+
     async def async_step_reauth(self, user_input=None):
         """Perform reauth upon an API authentication error."""
         self._reauth_entry = self.hass.config_entries.async_get_entry(
@@ -209,6 +261,10 @@ class PulseOptionsFlowHandler(OptionsFlowWithConfigEntry):
             return {"base": "min_relogin"}
         if new_keepalive > ADT_MAX_KEEPALIVE_INTERVAL:
             return {"base": "max_keepalive"}
+        if options.get(CONF_ACTIVE_POLL_INTERVAL, 0) > options.get(
+            CONF_SCAN_INTERVAL, ADT_DEFAULT_POLL_INTERVAL
+        ):
+            return {"base": "max_active_poll"}
         return {"title": "Pulse Integration Options"}
 
     @staticmethod
@@ -223,6 +279,12 @@ class PulseOptionsFlowHandler(OptionsFlowWithConfigEntry):
                         CONF_SCAN_INTERVAL, ADT_DEFAULT_POLL_INTERVAL
                     ),
                 ): cv.positive_float,
+                vol.Optional(
+                    CONF_ACTIVE_POLL_INTERVAL,
+                    default=original_input.get(
+                        CONF_ACTIVE_POLL_INTERVAL, DEFAULT_ACTIVE_POLL_INTERVAL
+                    ),
+                ): cv.positive_float,
                 vol.Optional(
                     CONF_RELOGIN_INTERVAL,
                     default=original_input.get(
@@ -235,6 +297,18 @@ class PulseOptionsFlowHandler(OptionsFlowWithConfigEntry):
                         CONF_KEEPALIVE_INTERVAL, ADT_DEFAULT_KEEPALIVE_INTERVAL
                     ),
                 ): cv.positive_int,
+                vol.Optional(
+                    CONF_MOTION_HOLD_TIME,
+                    default=original_input.get(
+                        CONF_MOTION_HOLD_TIME, DEFAULT_MOTION_HOLD_TIME
+                    ),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_TROUBLE_DELAY,
+                    default=original_input.get(
+                        CONF_TROUBLE_DELAY, DEFAULT_TROUBLE_DELAY
+                    ),
+                ): cv.positive_int,
             }
         )
         return OPTIONS_SCHEMA
@@ -7,5 +7,21 @@ CONF_FINGERPRINT = "fingerprint"
 CONF_HOSTNAME = "hostname"
 CONF_RELOGIN_INTERVAL = "relogin_interval"
 CONF_KEEPALIVE_INTERVAL = "keepalive_interval"
+CONF_MOTION_HOLD_TIME = "motion_hold_time"
+CONF_TROUBLE_DELAY = "trouble_delay"
+CONF_ACTIVE_POLL_INTERVAL = "active_poll_interval"
+
+# seconds motion sensors stay on after motion ends, 0 to disable
+DEFAULT_MOTION_HOLD_TIME = 0
+# seconds zone trouble has to persist before trouble sensors turn on, 0 to disable
+DEFAULT_TROUBLE_DELAY = 0
+# seconds between polls while armed or after zone activity, 0 to disable
+DEFAULT_ACTIVE_POLL_INTERVAL = 0.0
+
+# fired once per update with every zone and alarm change of a site
+EVENT_ZONES_CHANGED = f"{ADTPULSE_DOMAIN}_zones_changed"
+
+# config entry minor version, records which entity registry migrations were done
+ENTITY_MIGRATION_VERSION = 2
 
 ADTPULSE_DATA_ATTRIBUTION = "Data provided by ADT"
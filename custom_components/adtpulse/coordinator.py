@@ -3,95 +3,650 @@
 from __future__ import annotations
 
 from logging import getLogger
-from asyncio import CancelledError, Task
+from asyncio import CancelledError, Task, sleep
+from dataclasses import dataclass, field
+from enum import IntFlag
+from time import perf_counter, time
 from typing import Any, Callable
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util.dt import as_local, utc_from_timestamp, utcnow
+from homeassistant.util.dt import as_local, utc_from_timestamp
+from pyadtpulse.alarm_panel import ADT_ALARM_OFF, ADT_ALARM_UNKNOWN
+from pyadtpulse.const import ADT_DEFAULT_POLL_INTERVAL
 from pyadtpulse.exceptions import (
     PulseExceptionWithBackoff,
     PulseExceptionWithRetry,
     PulseLoginException,
 )
+from pyadtpulse.gateway import ADTPulseGateway
 from pyadtpulse.pyadtpulse_async import PyADTPulseAsync
+from pyadtpulse.site import ADTPulseSite
+from pyadtpulse.zones import ADTPulseZoneData
 
-from .const import ADTPULSE_DOMAIN
+from .commands import ADTPulseAlarmCommandQueue
+from .const import ADTPULSE_DOMAIN, CONF_ACTIVE_POLL_INTERVAL, EVENT_ZONES_CHANGED
+from .metrics import (
+    ADTPulseMetrics,
+    DISPATCH_BUCKETS,
+    ENTITY_WRITE_BUCKETS,
+    Histogram,
+)
+from .session import async_replace_credentials, get_last_login_time
+from .topology import ADTPulseCachedSite, ADTPulseTopologyStore, topology_changed
+from .utils import get_site_zones, zone_is_in_trouble, zone_is_open
+from .zone_events import ADTPulseZoneEventBuffer
 
 LOG = getLogger(__name__)
 
 ALARM_CONTEXT = "Alarm"
+ARM_READINESS_CONTEXT = "ArmReadiness"
+GATEWAY_CONTEXT = "Gateway"
 ZONE_CONTEXT_PREFIX = "Zone "
 ZONE_TROUBLE_PREFIX = " Trouble"
 CONNECTION_STATUS_CONTEXT = "ConnectionStatus"
 NEXT_REFRESH_CONTEXT = "NextRefresh"
+METRICS_CONTEXT = "Metrics"
+
+# seconds between login attempts when starting from cached sites
+LOGIN_RETRY_INTERVAL = 60
+
+# seconds the active poll interval is kept after zone activity
+ACTIVITY_POLL_WINDOW = 300
+# alarm statuses polled at the idle interval, any other is armed or changing
+IDLE_ALARM_STATUSES = (ADT_ALARM_OFF, ADT_ALARM_UNKNOWN)
+
+# listeners called on every partial update
+STATUS_CONTEXTS = (CONNECTION_STATUS_CONTEXT, NEXT_REFRESH_CONTEXT, METRICS_CONTEXT)
+
+
+class ZoneField(IntFlag):
+    """Zone data fields which can change between updates."""
+
+    NONE = 0
+    STATE = 1
+    STATUS = 2
+    LAST_ACTIVITY = 4
+    ALL = STATE | STATUS | LAST_ACTIVITY
+
+
+@dataclass(slots=True)
+class ADTPulseChangeSet:
+    """Changes to a site reported by a single ADT Pulse update.
+
+    Fields:
+        alarm_changed (bool): alarm status changed
+        gateway_changed (bool): gateway status, connection or polling changed
+        arm_readiness_changed (bool): the zones blocking arming changed
+        zones (dict[int, ZoneField]): changed zone ids and the fields which changed
+        zone_transitions (list[tuple[int, tuple[str, str, int], tuple[str, str, int]]]):
+            zone id, old and new (state, status, last activity) of changed
+            zones seen before
+        alarm_transition (tuple[str, str] | None): old and new alarm status if
+            it changed
+    """
+
+    alarm_changed: bool = False
+    gateway_changed: bool = False
+    arm_readiness_changed: bool = False
+    zones: dict[int, ZoneField] = field(default_factory=dict)
+    zone_transitions: list[tuple[int, tuple[str, str, int], tuple[str, str, int]]] = (
+        field(default_factory=list)
+    )
+    alarm_transition: tuple[str, str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneListenerContext:
+    """Listener context for entities showing zone data.
+
+    Fields:
+        zone_id (int): zone id
+        fields (ZoneField): zone fields the entity displays
+        name (str): context name, used for logging
+    """
+
+    zone_id: int
+    fields: ZoneField
+    name: str
+
+
+class ADTPulseArmReadiness:
+    """Zones keeping a site from being armed without forcing it.
+
+    Kept up to date from zone changes so arm checks don't scan every zone.
+    """
+
+    __slots__ = ("_site", "open_zones", "trouble_zones")
+
+    def __init__(self, site: ADTPulseSite):
+        """Initialize the index from the current zone data.
+
+        Args:
+            site (ADTPulseSite): site whose zones are indexed
+        """
+        self._site = site
+        self.open_zones: set[int] = set()
+        self.trouble_zones: set[int] = set()
+        self.rebuild()
+
+    @property
+    def can_arm(self) -> bool:
+        """Return whether the site can be armed without forcing it."""
+        return (
+            bool(get_site_zones(self._site))
+            and not self.open_zones
+            and not self.trouble_zones
+        )
+
+    def rebuild(self) -> None:
+        """Rebuild the index from every zone."""
+        self.open_zones.clear()
+        self.trouble_zones.clear()
+        for zone_id, zone in get_site_zones(self._site).items():
+            self.update_zone(zone_id, zone)
+
+    def update_zone(self, zone_id: int, zone: ADTPulseZoneData) -> bool:
+        """Update the index for a changed zone.
+
+        Args:
+            zone_id (int): zone id
+            zone (ADTPulseZoneData): zone data
+
+        Returns:
+            bool: True if the zones blocking arming changed
+        """
+        changed = _set_membership(self.open_zones, zone_id, zone_is_open(zone))
+        if _set_membership(self.trouble_zones, zone_id, zone_is_in_trouble(zone)):
+            changed = True
+        return changed
+
+    def zone_names(self, zone_ids: set[int]) -> list[str]:
+        """Return the sorted names of zones.
+
+        Args:
+            zone_ids (set[int]): zone ids, i.e. open_zones or trouble_zones
+
+        Returns:
+            list[str]: zone names
+        """
+        zones = get_site_zones(self._site)
+        return sorted(zones[zone_id].name for zone_id in zone_ids if zone_id in zones)
+
+    def blocking_zone_names(self) -> list[str]:
+        """Return the sorted names of open or troubled zones."""
+        return self.zone_names(self.open_zones | self.trouble_zones)
+
+
+def _set_membership(zone_ids: set[int], zone_id: int, member: bool) -> bool:
+    if member == (zone_id in zone_ids):
+        return False
+    if member:
+        zone_ids.add(zone_id)
+    else:
+        zone_ids.discard(zone_id)
+    return True
 
 
-class ADTPulseDataUpdateCoordinator(DataUpdateCoordinator):
-    """Update Coordinator for ADT Pulse entities."""
+def _gateway_snapshot(gateway: ADTPulseGateway) -> tuple:
+    return (
+        gateway.is_online,
+        gateway.primary_connection_type,
+        gateway.broadband_connection_status,
+        gateway.cellular_connection_status,
+        gateway.backoff.get_current_backoff_interval(),
+        gateway.backoff.initial_backoff_interval,
+        gateway.next_update,
+        gateway.last_update,
+    )
 
-    def __init__(self, hass: HomeAssistant, pulse_service: PyADTPulseAsync):
+
+def _zone_snapshot(zone: ADTPulseZoneData) -> tuple[str, str, int]:
+    return (zone.state, zone.status, zone.last_activity_timestamp)
+
+
+def _zone_changes(old: tuple[str, str, int], new: tuple[str, str, int]) -> ZoneField:
+    changes = ZoneField.NONE
+    if old[0] != new[0]:
+        changes |= ZoneField.STATE
+    if old[1] != new[1]:
+        changes |= ZoneField.STATUS
+    if old[2] != new[2]:
+        changes |= ZoneField.LAST_ACTIVITY
+    return changes
+
+
+class ADTPulseDataUpdateCoordinator(DataUpdateCoordinator[ADTPulseChangeSet | None]):
+    """Update Coordinator for the ADT Pulse entities of a single site.
+
+    Data is the change set of the last update, or None to update every entity.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, pulse_service: PyADTPulseAsync, site: ADTPulseSite
+    ):
         """Initialize Pulse data update coordinator.
 
         Args:
             hass (HomeAssistant): hass object
-            pulse_site (ADTPulseSite): ADT Pulse site
+            pulse_service (PyADTPulseAsync): ADT Pulse service
+            site (ADTPulseSite): ADT Pulse site whose entities this coordinates
         """
-        LOG.debug("%s: creating update coordinator", ADTPULSE_DOMAIN)
+        LOG.debug("%s: creating update coordinator for site %s", ADTPULSE_DOMAIN, site.id)
         self._adt_pulse = pulse_service
-        self._update_task: Task | None = None
+        self._site = site
         super().__init__(
             hass,
             LOG,
-            name=ADTPULSE_DOMAIN,
+            name=f"{ADTPULSE_DOMAIN} {site.id}",
         )
-        self._listener_dictionary: dict[str, CALLBACK_TYPE] = {}
+        # callbacks by context and by zone id, with the zone fields as int so
+        # dispatch doesn't go through IntFlag
+        self._context_listeners: dict[Any, list[CALLBACK_TYPE]] = {}
+        self._zone_listeners: dict[int, list[tuple[int, CALLBACK_TYPE]]] = {}
+        # entity state writes done and skipped as redundant on updates
+        self.performed_writes = 0
+        self.skipped_writes = 0
+        # zone sensor updates not written while a change is held back
+        self.suppressed_writes = 0
+        self.dispatch_seconds = Histogram(DISPATCH_BUCKETS)
+        self.entities_written = Histogram(ENTITY_WRITE_BUCKETS)
+        self.arm_readiness = ADTPulseArmReadiness(site)
+        self.alarm_commands = ADTPulseAlarmCommandQueue()
+        self.zone_events = ADTPulseZoneEventBuffer()
+        # device class by zone id, for zone change events
+        self.zone_device_classes: dict[int, str | None] = {}
+        self._alarm_status = site.alarm_control_panel.status
+        self._gateway_snapshot = _gateway_snapshot(site.gateway)
+        self._zone_snapshots: dict[int, tuple[str, str, int]] = {}
+        self._resync_zones()
 
     @property
     def adtpulse(self) -> PyADTPulseAsync:
         """Return the ADT Pulse service object."""
         return self._adt_pulse
 
+    @property
+    def site(self) -> ADTPulseSite:
+        """Return the ADT Pulse site for this coordinator."""
+        return self._site
+
+    @property
+    def site_is_live(self) -> bool:
+        """Return whether the site is from the logged in service.
+
+        A site restored from cache only has the last known state, which
+        mustn't be shown as current.
+        """
+        return not isinstance(self._site, ADTPulseCachedSite)
+
+    def attach_site(self, site: ADTPulseSite) -> None:
+        """Switch to the live site replacing the one restored from cache.
+
+        Entities pick up the new site on the next update, which should be a
+        full one.
+
+        Args:
+            site (ADTPulseSite): site with the same id from the logged in service
+        """
+        self._site = site
+        self.arm_readiness = ADTPulseArmReadiness(site)
+        self._alarm_status = site.alarm_control_panel.status
+        self._gateway_snapshot = _gateway_snapshot(site.gateway)
+        self._resync_zones()
+
+    def _resync_zones(self) -> None:
+        """Rebuild zone snapshots and arm readiness from every zone."""
+        self._zone_snapshots.clear()
+        for zone_id, zone in get_site_zones(self._site).items():
+            self._zone_snapshots[zone_id] = _zone_snapshot(zone)
+        self.arm_readiness.rebuild()
+
+    def create_change_set(
+        self, alarm_changed: bool, zone_ids: set[int]
+    ) -> ADTPulseChangeSet:
+        """Create the change set for an update reported by pyadtpulse.
+
+        Args:
+            alarm_changed (bool): pyadtpulse reported an alarm status change
+            zone_ids (set[int]): zone ids pyadtpulse reported as updated
+
+        Returns:
+            ADTPulseChangeSet: the changes, zones without changed fields are left out
+        """
+        gateway_snapshot = _gateway_snapshot(self._site.gateway)
+        changes = ADTPulseChangeSet(
+            alarm_changed, gateway_snapshot != self._gateway_snapshot
+        )
+        self._gateway_snapshot = gateway_snapshot
+        alarm_status = self._site.alarm_control_panel.status
+        if alarm_status != self._alarm_status:
+            changes.alarm_transition = (self._alarm_status, alarm_status)
+            self._alarm_status = alarm_status
+        zones = get_site_zones(self._site)
+        received = time()
+        for zone_id in zone_ids:
+            zone = zones.get(zone_id)
+            if zone is None:
+                continue
+            new_snapshot = _zone_snapshot(zone)
+            old_snapshot = self._zone_snapshots.get(zone_id)
+            self._zone_snapshots[zone_id] = new_snapshot
+            if old_snapshot is None:
+                zone_changes = ZoneField.ALL
+            else:
+                zone_changes = _zone_changes(old_snapshot, new_snapshot)
+            if not zone_changes:
+                continue
+            changes.zones[zone_id] = zone_changes
+            if old_snapshot is not None:
+                changes.zone_transitions.append((zone_id, old_snapshot, new_snapshot))
+                self.zone_events.append(
+                    zone_id, old_snapshot[0], *new_snapshot, received
+                )
+            if zone_changes & (ZoneField.STATE | ZoneField.STATUS):
+                if self.arm_readiness.update_zone(zone_id, zone):
+                    changes.arm_readiness_changed = True
+        return changes
+
     @callback
     def async_add_listener(
         self, update_callback: CALLBACK_TYPE, context: Any = None
     ) -> Callable[[], None]:
         """Listen for data updates."""
-        self._listener_dictionary[context] = update_callback
-        return super().async_add_listener(update_callback, context)
+        remove_listener = super().async_add_listener(update_callback, context)
+        if isinstance(context, ZoneListenerContext):
+            zone_entry = (int(context.fields), update_callback)
+            zone_listeners = self._zone_listeners.setdefault(context.zone_id, [])
+            zone_listeners.append(zone_entry)
+
+            @callback
+            def remove_zone_listener() -> None:
+                remove_listener()
+                zone_listeners.remove(zone_entry)
+
+            return remove_zone_listener
+
+        context_listeners = self._context_listeners.setdefault(context, [])
+        context_listeners.append(update_callback)
+
+        @callback
+        def remove_context_listener() -> None:
+            remove_listener()
+            context_listeners.remove(update_callback)
+
+        return remove_context_listener
+
+    @callback
+    def _async_call_context_listeners(self, context: Any) -> None:
+        for update_callback in self._context_listeners.get(context, ()):
+            update_callback()
 
     @callback
     def async_update_listeners(self) -> None:
         """Update listeners based update returned data."""
 
-        start_time = utcnow()
+        start_time = perf_counter()
+        performed_writes = self.performed_writes
+        if not self.data or self.data.alarm_changed:
+            # before the alarm entity's listener, so it sees the command done
+            self.alarm_commands.async_observe_status(
+                self._site.alarm_control_panel.status
+            )
         if not self.data:
+            # zone data may have changed without being reported
+            self._resync_zones()
             super().async_update_listeners()
-            LOG.debug(
-                "%s: async_update_listeners took %s",
-                ADTPULSE_DOMAIN,
-                utcnow() - start_time,
+            self._record_dispatch("", start_time, performed_writes)
+            return
+        changes = self.data
+        if changes.alarm_changed:
+            self._async_call_context_listeners(ALARM_CONTEXT)
+        if changes.gateway_changed:
+            self._async_call_context_listeners(GATEWAY_CONTEXT)
+        if changes.arm_readiness_changed:
+            self._async_call_context_listeners(ARM_READINESS_CONTEXT)
+        zone_listeners = self._zone_listeners
+        for zone_id, zone_fields in changes.zones.items():
+            changed = int(zone_fields)
+            for listener_fields, update_callback in zone_listeners.get(zone_id, ()):
+                if listener_fields & changed:
+                    update_callback()
+        for context in STATUS_CONTEXTS:
+            self._async_call_context_listeners(context)
+        if changes.zone_transitions or changes.alarm_transition:
+            self._async_fire_zones_changed(changes)
+        self._record_dispatch("partial ", start_time, performed_writes)
+
+    @callback
+    def _async_fire_zones_changed(self, changes: ADTPulseChangeSet) -> None:
+        """Fire a single event with every zone and alarm change of an update."""
+        zones = get_site_zones(self._site)
+        zone_changes = []
+        for zone_id, old, new in changes.zone_transitions:
+            zone = zones.get(zone_id)
+            zone_changes.append(
+                {
+                    "zone_id": zone_id,
+                    "name": zone.name if zone is not None else None,
+                    "device_class": self.zone_device_classes.get(zone_id),
+                    "old_state": old[0],
+                    "state": new[0],
+                    "old_status": old[1],
+                    "status": new[1],
+                    "last_activity": as_local(utc_from_timestamp(new[2])).isoformat(),
+                }
+            )
+        alarm = None
+        if changes.alarm_transition is not None:
+            old_status, status = changes.alarm_transition
+            alarm = {"old_status": old_status, "status": status}
+        self.hass.bus.async_fire(
+            EVENT_ZONES_CHANGED,
+            {"site_id": self._site.id, "zones": zone_changes, "alarm": alarm},
+        )
+
+    def _record_dispatch(self, kind: str, start_time: float, performed_writes: int):
+        took = perf_counter() - start_time
+        self.dispatch_seconds.observe(took)
+        self.entities_written.observe(self.performed_writes - performed_writes)
+        LOG.debug(
+            "%s: %sasync_update_listeners for site %s took %.6fs",
+            ADTPULSE_DOMAIN,
+            kind,
+            self._site.id,
+            took,
+        )
+
+
+class ADTPulseUpdateManager:
+    """Receive ADT Pulse updates and hand them to the per-site coordinators.
+
+    pyadtpulse only supports a single waiter on its update event, so one task
+    per config entry waits for updates and each site's coordinator dispatches
+    its own changes.  pyadtpulse only retrieves one site per login though, so
+    for now there is a single coordinator.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        pulse_service: PyADTPulseAsync,
+        entry: ConfigEntry,
+        topology_store: ADTPulseTopologyStore,
+        cached_sites: list[ADTPulseCachedSite] | None = None,
+    ):
+        """Initialize the update manager.
+
+        Args:
+            hass (HomeAssistant): hass object
+            pulse_service (PyADTPulseAsync): ADT Pulse service, logged in unless
+                cached_sites is given
+            entry (ConfigEntry): config entry owning the service
+            topology_store (ADTPulseTopologyStore): store for the sites and
+                their last known state
+            cached_sites (list[ADTPulseCachedSite] | None): sites restored from the
+                topology store, the service logs in when the manager starts
+        """
+        self.hass = hass
+        self.config_entry = entry
+        self._adt_pulse = pulse_service
+        self._topology_store = topology_store
+        self._update_task: Task | None = None
+        self._logged_in = cached_sites is None
+        if cached_sites is None:
+            # pyadtpulse only supports one site per login
+            cached_sites = [pulse_service.site]
+        self.coordinators: dict[str, ADTPulseDataUpdateCoordinator] = {
+            site.id: ADTPulseDataUpdateCoordinator(hass, pulse_service, site)
+            for site in cached_sites
+        }
+        self._poll_interval = float(ADT_DEFAULT_POLL_INTERVAL)
+        self._active_poll_interval: float | None = None
+        self._cancel_poll_timer: CALLBACK_TYPE | None = None
+        self.metrics = ADTPulseMetrics()
+        if self._logged_in:
+            # setup logged in
+            self.metrics.logins += 1
+        # to count the relogins pyadtpulse does by itself
+        self._last_login_time = get_last_login_time(pulse_service)
+
+    @property
+    def logged_in(self) -> bool:
+        """Return whether the service has logged in."""
+        return self._logged_in
+
+    @property
+    def sites(self) -> list[ADTPulseSite]:
+        """Return the sites entities were created for."""
+        return [coordinator.site for coordinator in self.coordinators.values()]
+
+    @property
+    def adtpulse(self) -> PyADTPulseAsync:
+        """Return the ADT Pulse service object."""
+        return self._adt_pulse
+
+    def set_poll_interval(
+        self, poll_interval: float, active_poll_interval: float | None = None
+    ) -> None:
+        """Set the poll interval of every site's gateway.
+
+        Args:
+            poll_interval (float): poll interval in seconds
+            active_poll_interval (float | None): shorter poll interval in seconds
+                while armed or after zone activity, None or 0 to always use
+                poll_interval
+        """
+        self._poll_interval = float(poll_interval)
+        self._active_poll_interval = (
+            min(float(active_poll_interval), self._poll_interval)
+            if active_poll_interval
+            else None
+        )
+        self._async_adapt_poll_interval()
+
+    @callback
+    def _async_adapt_poll_interval(self) -> None:
+        """Poll each site at the active interval while there's something going on.
+
+        That's while the alarm is armed or changing, and for
+        ACTIVITY_POLL_WINDOW seconds after a zone event.  An offline gateway or
+        an update error keeps the idle interval, since pyadtpulse backs off from
+        the poll interval.
+        """
+        if self._cancel_poll_timer is not None:
+            self._cancel_poll_timer()
+            self._cancel_poll_timer = None
+        recheck_in: float | None = None
+        for coordinator in self.coordinators.values():
+            site = coordinator.site
+            poll_interval = self._poll_interval
+            if (
+                self._active_poll_interval is not None
+                and site.gateway.is_online
+                and coordinator.last_exception is None
+            ):
+                last_activity = coordinator.zone_events.last_received
+                activity_left = (
+                    last_activity + ACTIVITY_POLL_WINDOW - time()
+                    if last_activity is not None
+                    else 0.0
+                )
+                if site.alarm_control_panel.status not in IDLE_ALARM_STATUSES:
+                    poll_interval = self._active_poll_interval
+                elif activity_left > 0:
+                    poll_interval = self._active_poll_interval
+                    recheck_in = (
+                        activity_left
+                        if recheck_in is None
+                        else min(recheck_in, activity_left)
+                    )
+            self._set_gateway_poll_interval(site, poll_interval)
+        if recheck_in is not None:
+            self._cancel_poll_timer = async_call_later(
+                self.hass, recheck_in, self._async_poll_timer_expired
+            )
+
+    @callback
+    def _async_poll_timer_expired(self, _now: Any) -> None:
+        self._cancel_poll_timer = None
+        self._async_adapt_poll_interval()
+
+    @staticmethod
+    def _set_gateway_poll_interval(site: ADTPulseSite, poll_interval: float) -> None:
+        if site.gateway.poll_interval == poll_interval:
+            return
+        try:
+            site.gateway.poll_interval = poll_interval
+        except ValueError as ex:
+            LOG.warning(
+                "Could not set poll interval to %f seconds: %s",
+                poll_interval,
+                ex,
             )
             return
-        data_to_update: tuple[bool, set[int]] = self.data
-        if data_to_update[0]:
-            self._listener_dictionary[ALARM_CONTEXT]()
-        for zones in data_to_update[1]:
-            self._listener_dictionary[ZONE_CONTEXT_PREFIX + str(zones)]()
-            self._listener_dictionary[
-                ZONE_CONTEXT_PREFIX + str(zones) + ZONE_TROUBLE_PREFIX
-            ]()
-        for i in CONNECTION_STATUS_CONTEXT, NEXT_REFRESH_CONTEXT:
-            self._listener_dictionary[i]()
         LOG.debug(
-            "%s: partial async_update_listeners took %s",
+            "%s: polling site %s every %.1f seconds",
             ADTPULSE_DOMAIN,
-            utcnow() - start_time,
+            site.id,
+            poll_interval,
         )
 
+    @callback
+    def async_set_updated_data(self, data: tuple[bool, set[int]] | None) -> None:
+        """Hand update data to the site coordinators.
+
+        pyadtpulse has a single site per login, so its changes are for every
+        coordinator there is.
+
+        Args:
+            data (tuple[bool, set[int]] | None): result of wait_for_update(),
+                None to update every entity
+        """
+        for coordinator in self.coordinators.values():
+            changes = None if data is None else coordinator.create_change_set(*data)
+            coordinator.async_set_updated_data(changes)
+        self._async_adapt_poll_interval()
+
+    @callback
+    def async_set_update_error(self, err: Exception) -> None:
+        """Report an update error to every site coordinator."""
+        self.metrics.record_error(err)
+        for coordinator in self.coordinators.values():
+            coordinator.async_set_update_error(err)
+            # async_set_update_error will only notify listeners on first error
+            # it also doesn't reset data
+            coordinator.data = None
+            if not coordinator.last_update_success:
+                coordinator.async_update_listeners()
+        self._async_adapt_poll_interval()
+
     async def start(self) -> None:
-        """Start ADT Pulse update coordinator.
+        """Start ADT Pulse update task.
 
         This doesn't really need to be async, but it is to yield the event loop.
         """
@@ -105,16 +660,133 @@ class ADTPulseDataUpdateCoordinator(DataUpdateCoordinator):
                 raise ConfigEntryNotReady
 
     async def stop(self):
-        """Stop ADT Pulse update coordinator."""
+        """Stop ADT Pulse update task."""
+        if self._cancel_poll_timer is not None:
+            self._cancel_poll_timer()
+            self._cancel_poll_timer = None
         if self._update_task:
             if not self._update_task.cancelled():
                 self._update_task.cancel()
             await self._update_task
             self._update_task = None
 
+    async def async_reauthenticate(self, password: str, fingerprint: str) -> None:
+        """Log in with a new password and fingerprint, keeping the entities.
+
+        Updates stop while logging in and resume afterwards, with a full update
+        so entities come back from being unavailable in a single write each.
+        If the login fails, the old credentials are restored and updates stay
+        stopped, as after the failure that led to reauthentication.
+
+        Args:
+            password (str): new password
+            fingerprint (str): new fingerprint
+
+        Raises:
+            ValueError: if the password or fingerprint isn't valid
+            the exceptions of PyADTPulseAsync.async_login()
+        """
+        await self.stop()
+        old_credentials = await async_replace_credentials(
+            self._adt_pulse, password, fingerprint
+        )
+        self._logged_in = False
+        try:
+            await self._adt_pulse.async_login()
+        except BaseException:
+            await async_replace_credentials(self._adt_pulse, *old_credentials)
+            raise
+        LOG.info("%s: logged in to ADT Pulse with new credentials", ADTPULSE_DOMAIN)
+        self._logged_in = True
+        self.metrics.logins += 1
+        self._last_login_time = get_last_login_time(self._adt_pulse)
+        if await self._async_reconcile_sites():
+            await self.start()
+
+    async def _async_login(self) -> bool:
+        """Log in after starting from cached sites, retrying until it works.
+
+        Returns:
+            bool: True if logged in, False if reauthentication is needed
+        """
+        while not self.hass.is_stopping:
+            try:
+                await self._adt_pulse.async_login()
+            except PulseExceptionWithBackoff as ex:
+                retry_in = LOGIN_RETRY_INTERVAL
+                if isinstance(ex, PulseExceptionWithRetry) and ex.retry_time:
+                    retry_in = max(retry_in, ex.retry_time - time())
+                LOG.warning(
+                    "%s: could not log in to ADT Pulse, retrying in %d seconds: %s",
+                    ADTPULSE_DOMAIN,
+                    retry_in,
+                    ex,
+                )
+                self.async_set_update_error(ex)
+                await sleep(retry_in)
+                continue
+            except PulseLoginException as ex:
+                LOG.error("%s: ADT Pulse login failed: %s", ADTPULSE_DOMAIN, ex)
+                self.async_set_update_error(ex)
+                if self.config_entry:
+                    self.config_entry.async_start_reauth(self.hass)
+                return False
+            self._logged_in = True
+            self.metrics.logins += 1
+            self._last_login_time = get_last_login_time(self._adt_pulse)
+            return True
+        return False
+
+    async def _async_reconcile_sites(self) -> bool:
+        """Switch the coordinators from cached to live sites.
+
+        Returns:
+            bool: True if switched, False if the entry is reloaded because
+                sites or zones were added or removed
+        """
+        live_sites = [self._adt_pulse.site]
+        if topology_changed(self.sites, live_sites):
+            LOG.info(
+                "%s: sites or zones changed since last start, reloading",
+                ADTPULSE_DOMAIN,
+            )
+            await self._topology_store.async_save(live_sites)
+            self.hass.config_entries.async_schedule_reload(
+                self.config_entry.entry_id
+            )
+            return False
+        for site in live_sites:
+            self.coordinators[site.id].attach_site(site)
+        options = self.config_entry.options
+        self.set_poll_interval(
+            options.get(CONF_SCAN_INTERVAL, ADT_DEFAULT_POLL_INTERVAL),
+            options.get(CONF_ACTIVE_POLL_INTERVAL),
+        )
+        for coordinator in self.coordinators.values():
+            coordinator.last_exception = None
+        self.async_set_updated_data(None)
+        return True
+
+    def _count_update(self) -> None:
+        self.metrics.updates_received += 1
+        last_login_time = get_last_login_time(self._adt_pulse)
+        if last_login_time != self._last_login_time:
+            self.metrics.relogins += 1
+            self._last_login_time = last_login_time
+
     async def _async_update_data(self) -> None:
         """Fetch data from ADT Pulse."""
-        while not self._shutdown_requested and not self.hass.is_stopping:
+        try:
+            if not self._logged_in:
+                if not await self._async_login():
+                    return
+                if not await self._async_reconcile_sites():
+                    return
+            await self._topology_store.async_save(self.sites)
+        except CancelledError:
+            LOG.debug("%s: coordinator received cancellation", ADTPULSE_DOMAIN)
+            return
+        while not self.hass.is_stopping:
             data = None
             LOG.debug("%s: coordinator waiting for updates", ADTPULSE_DOMAIN)
             update_exception: Exception | None = None
@@ -126,6 +798,7 @@ class ADTPulseDataUpdateCoordinator(DataUpdateCoordinator):
                     ADTPULSE_DOMAIN,
                     ex,
                 )
+                self.metrics.record_error(ex)
                 if self.config_entry:
                     self.config_entry.async_start_reauth(self.hass)
                 return
@@ -154,16 +827,15 @@ class ADTPulseDataUpdateCoordinator(DataUpdateCoordinator):
                     ex,
                 )
                 raise
-            finally:
-                if update_exception:
-                    self.async_set_update_error(update_exception)
-                    # async_set_update_error will only notify listeners on first error
-                    # it also doesn't reset data
-                    self.data = None
-                    if not self.last_update_success:
-                        self.async_update_listeners()
-                else:
-                    self.last_exception = None
-                    self.async_set_updated_data(data)
+            # only reached by updates that completed, or failed with a backoff
+            if update_exception:
+                self.async_set_update_error(update_exception)
+            else:
+                if data is not None:
+                    self._count_update()
+                for coordinator in self.coordinators.values():
+                    coordinator.last_exception = None
+                self.async_set_updated_data(data)
+                self._topology_store.async_schedule_save(self.sites)
 
             LOG.debug("%s: coordinator received update notification", ADTPULSE_DOMAIN)
@@ -0,0 +1,62 @@
+"""Diagnostics of the ADT Pulse integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import ADTPULSE_DOMAIN, CONF_FINGERPRINT
+from .coordinator import ADTPulseUpdateManager
+from .supervisor import get_supervisor
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, CONF_FINGERPRINT}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass (HomeAssistant): hass object
+        entry (ConfigEntry): the config entry
+
+    Returns:
+        dict[str, Any]: the diagnostics
+    """
+    manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
+    metrics = manager.metrics
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "logged_in": manager.logged_in,
+        "metrics": {
+            "updates_received": metrics.updates_received,
+            "logins": metrics.logins,
+            "relogins": metrics.relogins,
+            "errors": dict(metrics.errors),
+        },
+        "sites": {
+            site_id: {
+                "entity_writes": {
+                    "performed": coordinator.performed_writes,
+                    "skipped": coordinator.skipped_writes,
+                    "suppressed": coordinator.suppressed_writes,
+                },
+                "dispatch_ms_mean": (
+                    None
+                    if coordinator.dispatch_seconds.mean is None
+                    else round(coordinator.dispatch_seconds.mean * 1000, 3)
+                ),
+                "zone_events": len(coordinator.zone_events),
+            }
+            for site_id, coordinator in manager.coordinators.items()
+        },
+        "supervisor": get_supervisor(hass).as_dict(),
+    }
@@ -0,0 +1,36 @@
+"""Fixed bucket histograms for the ADT Pulse metrics."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Iterable[float]):
+        """Initialize the histogram.
+
+        Args:
+            buckets (Iterable[float]): ascending bucket upper bounds, +Inf is
+                added
+        """
+        self.buckets = tuple(buckets)
+        # per bucket, the last one is +Inf
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the values, None if there are none."""
+        return self.sum / self.count if self.count else None
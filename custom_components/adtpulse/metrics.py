@@ -0,0 +1,212 @@
+"""Performance metrics of the ADT Pulse integration."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Iterable
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from pyadtpulse.exceptions import PulseExceptionWithBackoff
+
+from .const import ADTPULSE_DOMAIN
+from .histogram import Histogram
+
+if TYPE_CHECKING:
+    from .coordinator import ADTPulseUpdateManager
+
+LOG = getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# histogram bucket upper bounds
+DISPATCH_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+ENTITY_WRITE_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+BACKOFF_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800)
+ALARM_COMMAND_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60)
+
+
+class ADTPulseMetrics:
+    """Metrics of a config entry, site metrics are kept by the coordinators."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.updates_received = 0
+        # logins by the integration, relogins are done by pyadtpulse itself
+        self.logins = 0
+        self.relogins = 0
+        self.errors: dict[str, int] = {}
+        self.backoff_seconds = Histogram(BACKOFF_BUCKETS)
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of update errors."""
+        return sum(self.errors.values())
+
+    def record_error(self, ex: Exception) -> None:
+        """Count an update error, and its backoff if it has one."""
+        name = type(ex).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+        if isinstance(ex, PulseExceptionWithBackoff):
+            self.backoff_seconds.observe(ex.backoff.get_current_backoff_interval())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _OpenMetricsWriter:
+    """Collect samples by metric family and render them as OpenMetrics text."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def _samples(self, name: str, metric_type: str, help_text: str) -> list[str]:
+        if name not in self._families:
+            self._families[name] = (metric_type, help_text, [])
+        return self._families[name][2]
+
+    def counter(
+        self, name: str, help_text: str, labels: dict[str, str], value: float
+    ) -> None:
+        self._samples(name, "counter", help_text).append(
+            f"{name}_total{{{_format_labels(labels)}}} {_format_value(value)}"
+        )
+
+    def gauge(
+        self, name: str, help_text: str, labels: dict[str, str], value: float
+    ) -> None:
+        self._samples(name, "gauge", help_text).append(
+            f"{name}{{{_format_labels(labels)}}} {_format_value(value)}"
+        )
+
+    def histogram(
+        self, name: str, help_text: str, labels: dict[str, str], histogram: Histogram
+    ) -> None:
+        samples = self._samples(name, "histogram", help_text)
+        cumulative = 0
+        bounds = [*(_format_value(float(b)) for b in histogram.buckets), "+Inf"]
+        for bound, count in zip(bounds, histogram.counts):
+            cumulative += count
+            bucket_labels = _format_labels({**labels, "le": bound})
+            samples.append(f"{name}_bucket{{{bucket_labels}}} {cumulative}")
+        label_text = _format_labels(labels)
+        samples.append(f"{name}_count{{{label_text}}} {histogram.count}")
+        samples.append(f"{name}_sum{{{label_text}}} {_format_value(histogram.sum)}")
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, (metric_type, help_text, samples) in self._families.items():
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"# HELP {name} {help_text}")
+            lines.extend(samples)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def render_openmetrics(managers: Iterable[ADTPulseUpdateManager]) -> str:
+    """Render the metrics of every config entry in OpenMetrics text format.
+
+    Args:
+        managers (Iterable[ADTPulseUpdateManager]): update manager of each
+            config entry
+
+    Returns:
+        str: the metrics
+    """
+    writer = _OpenMetricsWriter()
+    for manager in managers:
+        entry = {"entry": manager.config_entry.entry_id}
+        metrics = manager.metrics
+        writer.counter(
+            "adtpulse_updates_received",
+            "Updates received from Pulse.",
+            entry,
+            metrics.updates_received,
+        )
+        for kind, count in (
+            ("full", metrics.logins),
+            ("relogin", metrics.relogins),
+        ):
+            writer.counter(
+                "adtpulse_logins", "Pulse logins.", {**entry, "kind": kind}, count
+            )
+        for error, count in metrics.errors.items():
+            writer.counter(
+                "adtpulse_update_errors",
+                "Update errors by exception type.",
+                {**entry, "type": error},
+                count,
+            )
+        writer.histogram(
+            "adtpulse_backoff_seconds",
+            "Backoff intervals of update errors.",
+            entry,
+            metrics.backoff_seconds,
+        )
+        for site_id, coordinator in manager.coordinators.items():
+            site = {**entry, "site": site_id}
+            writer.histogram(
+                "adtpulse_update_dispatch_seconds",
+                "Time to hand an update to the entities.",
+                site,
+                coordinator.dispatch_seconds,
+            )
+            writer.histogram(
+                "adtpulse_entities_written",
+                "Entity states written per update.",
+                site,
+                coordinator.entities_written,
+            )
+            for result, count in (
+                ("performed", coordinator.performed_writes),
+                ("skipped", coordinator.skipped_writes),
+                ("suppressed", coordinator.suppressed_writes),
+            ):
+                writer.counter(
+                    "adtpulse_entity_updates",
+                    "Entity updates by whether the state was written.",
+                    {**site, "result": result},
+                    count,
+                )
+            writer.gauge(
+                "adtpulse_zone_events",
+                "Zone events kept in memory.",
+                site,
+                len(coordinator.zone_events),
+            )
+            latencies = coordinator.alarm_commands.latency_seconds
+            for command, histogram in latencies.items():
+                writer.histogram(
+                    "adtpulse_alarm_command_seconds",
+                    "Time from sending an alarm command to Pulse confirming it.",
+                    {**site, "command": command},
+                    histogram,
+                )
+    return writer.render()
+
+
+class ADTPulseMetricsView(HomeAssistantView):
+    """Serve the metrics of every ADT Pulse config entry for scraping."""
+
+    url = f"/api/{ADTPULSE_DOMAIN}/metrics"
+    name = f"api:{ADTPULSE_DOMAIN}:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics in OpenMetrics text format."""
+        hass = request.app[KEY_HASS]
+        managers = hass.data.get(ADTPULSE_DOMAIN, {}).values()
+        return web.Response(
+            status=HTTPStatus.OK,
+            body=render_openmetrics(managers).encode(),
+            headers={"Content-Type": OPENMETRICS_CONTENT_TYPE},
+        )
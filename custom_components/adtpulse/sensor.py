@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from logging import getLogger
-from datetime import datetime, timedelta
-
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -28,7 +36,9 @@ from .base_entity import ADTPulseEntity
 from .const import ADTPULSE_DOMAIN
 from .coordinator import (
     ADTPulseDataUpdateCoordinator,
+    ADTPulseUpdateManager,
     CONNECTION_STATUS_CONTEXT,
+    METRICS_CONTEXT,
     NEXT_REFRESH_CONTEXT,
 )
 from .utils import get_gateway_unique_id
@@ -49,30 +59,101 @@ COORDINATOR_EXCEPTION_MAP: dict[type[Exception], tuple[str, str]] = {
     PulseNotLoggedInError: ("Not Logged In", "mdi:account-off"),
 }
 CONNECTION_STATUS_OK = ("Connection OK", "mdi:hand-okay")
+# until the first login after starting from cached sites
+CONNECTION_STATUS_CONNECTING = ("Connecting", "mdi:lan-connect")
 CONNECTION_STATUSES = list(COORDINATOR_EXCEPTION_MAP.values())
 CONNECTION_STATUSES.append(CONNECTION_STATUS_OK)
+CONNECTION_STATUSES.append(CONNECTION_STATUS_CONNECTING)
 CONNECTION_STATUS_STRINGS = [value[0] for value in CONNECTION_STATUSES]
 
 
+@dataclass(frozen=True, kw_only=True)
+class ADTPulseMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes an ADT Pulse metric sensor."""
+
+    value_fn: Callable[
+        [ADTPulseDataUpdateCoordinator, ADTPulseUpdateManager], float | int | None
+    ]
+
+
+def _average_dispatch_ms(
+    coordinator: ADTPulseDataUpdateCoordinator, _manager: ADTPulseUpdateManager
+) -> float | None:
+    mean = coordinator.dispatch_seconds.mean
+    return None if mean is None else round(mean * 1000, 3)
+
+
+METRIC_SENSORS = (
+    ADTPulseMetricSensorEntityDescription(
+        key="updates_received",
+        name="Pulse Updates Received",
+        icon="mdi:cloud-download",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _coordinator, manager: manager.metrics.updates_received,
+    ),
+    ADTPulseMetricSensorEntityDescription(
+        key="update_errors",
+        name="Pulse Update Errors",
+        icon="mdi:cloud-alert",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda _coordinator, manager: manager.metrics.error_count,
+    ),
+    ADTPulseMetricSensorEntityDescription(
+        key="logins",
+        name="Pulse Logins",
+        icon="mdi:login",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        # full logins by the integration and by pyadtpulse itself
+        value_fn=lambda _coordinator, manager: (
+            manager.metrics.logins + manager.metrics.relogins
+        ),
+    ),
+    ADTPulseMetricSensorEntityDescription(
+        key="entity_writes",
+        name="Pulse Entity Writes",
+        icon="mdi:database-edit",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator, _manager: coordinator.performed_writes,
+    ),
+    ADTPulseMetricSensorEntityDescription(
+        key="dispatch_time",
+        name="Pulse Update Dispatch Time",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=3,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_average_dispatch_ms,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up sensors for an ADT Pulse installation."""
-    coordinator: ADTPulseDataUpdateCoordinator = hass.data[ADTPULSE_DOMAIN][
-        entry.entry_id
-    ]
+    manager: ADTPulseUpdateManager = hass.data[ADTPULSE_DOMAIN][entry.entry_id]
 
     async_add_entities(
-        [
+        entity
+        for coordinator in manager.coordinators.values()
+        for entity in (
             ADTPulseConnectionStatus(coordinator),
             ADTPulseNextRefresh(coordinator),
-        ]
+            *(
+                ADTPulseMetricSensor(coordinator, manager, description)
+                for description in METRIC_SENSORS
+            ),
+        )
     )
 
 
 class ADTPulseConnectionStatus(SensorEntity, ADTPulseEntity):
     """ADT Pulse connection status sensor."""
 
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_name = "Pulse Connection Status"
+    _attr_options = CONNECTION_STATUS_STRINGS
+
     def __init__(self, coordinator: ADTPulseDataUpdateCoordinator):
         """Initialize connection status sensor.
 
@@ -80,7 +161,7 @@ class ADTPulseConnectionStatus(SensorEntity, ADTPulseEntity):
             coordinator (ADTPulseDataUpdateCoordinator):
                 HASS data update coordinator
         """
-        site_name = coordinator.adtpulse.site.id
+        site_name = coordinator.site.id
         LOG.debug(
             "%s: adding connection status sensor for site %s",
             ADTPULSE_DOMAIN,
@@ -89,76 +170,41 @@ class ADTPulseConnectionStatus(SensorEntity, ADTPulseEntity):
 
         self._name = CONNECTION_STATUS_CONTEXT
         super().__init__(coordinator, self._name)
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the sensor."""
-        return "Pulse Connection Status"
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return f"{self.coordinator.adtpulse.site.id}-connection-status"
+        self._attr_unique_id = f"{coordinator.site.id}-connection-status"
+        self._attr_device_info = _get_gateway_device_info(self)
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return True
 
-    @property
-    def device_class(self) -> str | None:
-        """Return the class of this sensor."""
-        return SensorDeviceClass.ENUM
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        return CONNECTION_STATUS_STRINGS
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.last_exception:
-            return CONNECTION_STATUS_OK[0]
-        coordinator_exception = COORDINATOR_EXCEPTION_MAP.get(
-            type(self.coordinator.last_exception), ("", "")
-        )
-        if coordinator_exception:
-            return coordinator_exception[0]
-        return None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon of this sensor."""
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the state and icon of the sensor."""
         if not self.coordinator.last_exception:
-            return CONNECTION_STATUS_OK[1]
-        coordinator_exception = COORDINATOR_EXCEPTION_MAP.get(
-            type(self.coordinator.last_exception), ("", "")
-        )
-        if coordinator_exception:
-            return coordinator_exception[1]
-        return "mdi:alert-octogram"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        if self._gateway.serial_number:
-            return DeviceInfo(
-                identifiers={(ADTPULSE_DOMAIN, self._gateway.serial_number)},
+            if self.coordinator.site_is_live:
+                self._attr_native_value, self._attr_icon = CONNECTION_STATUS_OK
+            else:
+                self._attr_native_value, self._attr_icon = CONNECTION_STATUS_CONNECTING
+        else:
+            coordinator_exception = COORDINATOR_EXCEPTION_MAP.get(
+                type(self.coordinator.last_exception)
             )
-        return DeviceInfo(
-            identifiers={(ADTPULSE_DOMAIN, get_gateway_unique_id(self._site))},
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        LOG.debug("Setting %s status to %s", self.name, self.native_value)
-        self.async_write_ha_state()
+            if coordinator_exception:
+                self._attr_native_value, self._attr_icon = coordinator_exception
+            else:
+                self._attr_native_value = None
+                self._attr_icon = "mdi:alert-octogram"
+        LOG.debug("Setting %s status to %s", self.name, self._attr_native_value)
 
 
 class ADTPulseNextRefresh(SensorEntity, ADTPulseEntity):
     """ADT Pulse next refresh sensor."""
 
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_name = "Pulse Next Refresh"
+
     def __init__(self, coordinator: ADTPulseDataUpdateCoordinator):
         """Initialize next refresh sensor.
 
@@ -166,7 +212,7 @@ class ADTPulseNextRefresh(SensorEntity, ADTPulseEntity):
             coordinator (ADTPulseDataUpdateCoordinator):
                 HASS data update coordinator
         """
-        site_name = coordinator.adtpulse.site.id
+        site_name = coordinator.site.id
         LOG.debug(
             "%s: adding next refresh sensor for site %s",
             ADTPULSE_DOMAIN,
@@ -175,58 +221,89 @@ class ADTPulseNextRefresh(SensorEntity, ADTPulseEntity):
 
         self._name = NEXT_REFRESH_CONTEXT
         super().__init__(coordinator, self._name)
+        self._attr_unique_id = f"{coordinator.site.id}-next-refresh"
+        self._attr_device_info = _get_gateway_device_info(self)
+        self._update_attrs()
 
-    @property
-    def device_class(self) -> str | None:
-        """Return the class of this sensor."""
-        return SensorDeviceClass.TIMESTAMP
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the state of the sensor."""
+    @callback
+    def _update_attrs(self) -> None:
+        """Update the state of the sensor."""
         timediff = 0
         curr_time = now()
         last_ex = self.coordinator.last_exception
-        if not last_ex:
-            return None
         if isinstance(last_ex, PulseExceptionWithRetry):
-            if last_ex.retry_time is None:
-                return None
-            timediff = last_ex.retry_time - as_timestamp(now())
+            if last_ex.retry_time is not None:
+                timediff = last_ex.retry_time - as_timestamp(curr_time)
         elif isinstance(last_ex, PulseExceptionWithBackoff):
             timediff = last_ex.backoff.get_current_backoff_interval()
-        if timediff < 60:
-            return None
-        return curr_time + timedelta(seconds=timediff)
+        self._attr_native_value = None
+        if timediff >= 60:
+            self._attr_native_value = curr_time + timedelta(seconds=timediff)
+        LOG.debug("Setting %s status to %s", self.name, self._attr_native_value)
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        if self._gateway.serial_number:
-            return DeviceInfo(
-                identifiers={(ADTPULSE_DOMAIN, self._gateway.serial_number)},
-            )
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_exception is not None
 
-        return DeviceInfo(
-            identifiers={(ADTPULSE_DOMAIN, get_gateway_unique_id(self._site))},
-        )
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return f"{self.coordinator.adtpulse.site.id}-next-refresh"
+class ADTPulseMetricSensor(SensorEntity, ADTPulseEntity):
+    """ADT Pulse integration metric sensor, disabled by default."""
 
-    @property
-    def name(self) -> str | None:
-        """Return the name of the sensor."""
-        return "Pulse Next Refresh"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # updated on every update, so their own writes would inflate the metrics
+    _count_writes = False
+    entity_description: ADTPulseMetricSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ADTPulseDataUpdateCoordinator,
+        manager: ADTPulseUpdateManager,
+        description: ADTPulseMetricSensorEntityDescription,
+    ):
+        """Initialize metric sensor.
+
+        Args:
+            coordinator (ADTPulseDataUpdateCoordinator):
+                HASS data update coordinator
+            manager (ADTPulseUpdateManager): update manager of the config entry
+            description (ADTPulseMetricSensorEntityDescription): the metric
+        """
+        LOG.debug(
+            "%s: adding %s metric sensor for site %s",
+            ADTPULSE_DOMAIN,
+            description.key,
+            coordinator.site.id,
+        )
+        self.entity_description = description
+        self._manager = manager
+        super().__init__(coordinator, description.key, METRICS_CONTEXT)
+        self._attr_name = description.name
+        self._attr_unique_id = f"{coordinator.site.id}-metric-{description.key}"
+        self._attr_device_info = _get_gateway_device_info(self)
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_exception is not None
+        return True
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        LOG.debug("Setting %s status to %s", self.name, self.native_value)
-        self.async_write_ha_state()
+    def _update_attrs(self) -> None:
+        """Update the state of the sensor."""
+        self._attr_native_value = self.entity_description.value_fn(
+            self.coordinator, self._manager
+        )
+
+
+def _get_gateway_device_info(entity: ADTPulseEntity) -> DeviceInfo:
+    """Return device info of the gateway the status sensors belong to."""
+    # pylint: disable=protected-access
+    if entity._gateway.serial_number:
+        return DeviceInfo(
+            identifiers={(ADTPULSE_DOMAIN, entity._gateway.serial_number)},
+        )
+    return DeviceInfo(
+        identifiers={(ADTPULSE_DOMAIN, get_gateway_unique_id(entity._site))},
+    )
@@ -0,0 +1,91 @@
+"""Services of the ADT Pulse integration."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from datetime import timedelta
+from time import time
+from typing import Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.util.dt import as_local, utc_from_timestamp
+
+from .const import ADTPULSE_DOMAIN
+from .coordinator import ADTPulseUpdateManager
+from .utils import get_site_zones
+
+LOG = getLogger(__name__)
+
+SERVICE_GET_ZONE_EVENTS = "get_zone_events"
+
+ATTR_DURATION = "duration"
+ATTR_SITE_ID = "site_id"
+ATTR_ZONES = "zones"
+
+GET_ZONE_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=timedelta(hours=1)): cv.positive_time_period,
+        vol.Optional(ATTR_SITE_ID): cv.string,
+        vol.Optional(ATTR_ZONES): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+    }
+)
+
+
+def _isoformat(timestamp: float) -> str:
+    return as_local(utc_from_timestamp(timestamp)).isoformat()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the ADT Pulse services.
+
+    Args:
+        hass (HomeAssistant): hass object
+    """
+
+    @callback
+    def async_get_zone_events(call: ServiceCall) -> ServiceResponse:
+        """Return the zone events kept for the requested time window."""
+        since = time() - call.data[ATTR_DURATION].total_seconds()
+        site_id = call.data.get(ATTR_SITE_ID)
+        zone_ids = set(call.data[ATTR_ZONES]) if ATTR_ZONES in call.data else None
+        events: list[dict[str, Any]] = []
+        manager: ADTPulseUpdateManager
+        for manager in hass.data[ADTPULSE_DOMAIN].values():
+            for coordinator in manager.coordinators.values():
+                site = coordinator.site
+                if site_id is not None and site.id != site_id:
+                    continue
+                zones = get_site_zones(site)
+                for event in coordinator.zone_events.query(since, zone_ids):
+                    zone = zones.get(event.zone_id)
+                    events.append(
+                        {
+                            "site_id": site.id,
+                            "zone_id": event.zone_id,
+                            "name": zone.name if zone is not None else None,
+                            "old_state": event.old_state,
+                            "state": event.state,
+                            "status": event.status,
+                            "last_activity": _isoformat(event.last_activity_timestamp),
+                            "received": _isoformat(event.received),
+                        }
+                    )
+        events.sort(key=lambda event: event["received"])
+        return {"events": events}
+
+    hass.services.async_register(
+        ADTPULSE_DOMAIN,
+        SERVICE_GET_ZONE_EVENTS,
+        async_get_zone_events,
+        schema=GET_ZONE_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,130 @@
+"""Creating and closing ADT Pulse services."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
+
+from pyadtpulse.const import (
+    ADT_DEFAULT_KEEPALIVE_INTERVAL,
+    ADT_DEFAULT_RELOGIN_INTERVAL,
+)
+from pyadtpulse.pyadtpulse_async import PyADTPulseAsync
+
+from .supervisor import ADTPulseSupervisor
+
+LOG = getLogger(__name__)
+
+
+class HassPyADTPulseAsync(PyADTPulseAsync):
+    """Pulse service whose logins can be supervised.
+
+    pyadtpulse logs in again by itself, so logins are hooked here rather than
+    where the integration logs in.
+    """
+
+    __slots__ = ("_supervisor",)
+
+    def __init__(
+        self,
+        *args: Any,
+        supervisor: ADTPulseSupervisor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            supervisor (ADTPulseSupervisor | None): schedules the logins,
+                None to run them right away like pyadtpulse
+            args, kwargs: passed to PyADTPulseAsync
+        """
+        self._supervisor = supervisor
+        super().__init__(*args, **kwargs)
+
+    def login_slot(self) -> AbstractAsyncContextManager[None]:
+        """Return a context to hold while talking to Pulse to log in."""
+        if self._supervisor is None:
+            return nullcontext()
+        return self._supervisor.async_login_slot()
+
+    async def async_login(self) -> None:
+        """Log in once the supervisor lets it, see PyADTPulseAsync.async_login()."""
+        async with self.login_slot():
+            await super().async_login()
+
+
+
+def create_pulse_service(
+    username: str,
+    password: str,
+    fingerprint: str,
+    service_host: str,
+    keepalive_interval: int = ADT_DEFAULT_KEEPALIVE_INTERVAL,
+    relogin_interval: int = ADT_DEFAULT_RELOGIN_INTERVAL,
+    supervisor: ADTPulseSupervisor | None = None,
+) -> HassPyADTPulseAsync:
+    """Create an ADT Pulse service.
+
+    With a supervisor, the logins of the service are spread out from those of
+    the other config entries.
+    """
+    return HassPyADTPulseAsync(
+        username,
+        password,
+        fingerprint,
+        service_host=service_host,
+        keepalive_interval=keepalive_interval,
+        relogin_interval=relogin_interval,
+        supervisor=supervisor,
+    )
+
+
+async def async_close_pulse_service(service: PyADTPulseAsync) -> None:
+    """Stop a service that isn't logged in and close its HTTP session."""
+    await _async_cancel_pulse_tasks(service)
+    # pylint: disable-next=protected-access
+    await service._pulse_connection.quick_logout()
+
+
+async def async_replace_credentials(
+    service: PyADTPulseAsync, password: str, fingerprint: str
+) -> tuple[str, str]:
+    """Drop the session of a service and give it a new password and fingerprint.
+
+    The service is left logged out.
+
+    Args:
+        service (PyADTPulseAsync): the service
+        password (str): new password
+        fingerprint (str): new fingerprint
+
+    Returns:
+        tuple[str, str]: the old password and fingerprint
+
+    Raises:
+        ValueError: if the password or fingerprint isn't valid
+    """
+    # pylint: disable=protected-access
+    authentication = service._authentication_properties
+    old_credentials = (authentication.password, authentication.fingerprint)
+    authentication.check_password(password)
+    authentication.check_fingerprint(fingerprint)
+    await _async_cancel_pulse_tasks(service)
+    await service._pulse_connection.quick_logout()
+    authentication.password = password
+    authentication.fingerprint = fingerprint
+    return old_credentials
+
+
+async def _async_cancel_pulse_tasks(service: PyADTPulseAsync) -> None:
+    # pylint: disable=protected-access
+    await service._cancel_task(service._timeout_task)
+    await service._cancel_task(service._sync_task)
+
+
+def get_last_login_time(service: PyADTPulseAsync) -> int:
+    """Return when the service last logged in, including its own relogins."""
+    # pylint: disable-next=protected-access
+    return service._authentication_properties.last_login_time
+
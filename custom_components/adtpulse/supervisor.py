@@ -0,0 +1,108 @@
+"""Scheduling of Pulse logins across config entries."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from asyncio import Semaphore, get_running_loop, sleep
+from contextlib import asynccontextmanager
+from random import uniform
+from time import monotonic
+from typing import Any, AsyncIterator
+
+from homeassistant.core import HomeAssistant
+from pyadtpulse.const import ADT_DEFAULT_LOGIN_TIMEOUT
+
+from .const import ADTPULSE_DOMAIN
+
+LOG = getLogger(__name__)
+
+# not under hass.data[ADTPULSE_DOMAIN], which maps entry ids to their update
+# managers and is iterated as such
+DATA_SUPERVISOR = f"{ADTPULSE_DOMAIN}_supervisor"
+
+# logins in flight at once across config entries
+MAX_CONCURRENT_LOGINS = 2
+# seconds between the starts of two logins, picked at random in this range
+LOGIN_SPACING = (1.0, 3.0)
+# seconds a login can hold its slot before other logins are let through
+MAX_LOGIN_SLOT_HOLD = 2 * ADT_DEFAULT_LOGIN_TIMEOUT
+
+
+class ADTPulseSupervisor:
+    """Spread the Pulse logins of every config entry.
+
+    Home Assistant sets up all config entries at once, so left alone every
+    account logs in together at startup and after an outage.
+
+    Logins are limited to MAX_CONCURRENT_LOGINS at a time, with a random
+    LOGIN_SPACING between their starts.  This includes the relogins
+    pyadtpulse does by itself, from its keepalive task at the relogin
+    interval and from its sync check task after errors.  So that a hung
+    login can't hold up setting up the other entries, a login gives up its
+    slot after MAX_LOGIN_SLOT_HOLD even if it hasn't finished.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the supervisor."""
+        self._login_slots = Semaphore(MAX_CONCURRENT_LOGINS)
+        self._next_login = 0.0
+        self.logins = 0
+        self.delayed_logins = 0
+        self.login_wait_seconds = 0.0
+        self.slow_logins = 0
+
+    @asynccontextmanager
+    async def async_login_slot(self) -> AsyncIterator[None]:
+        """Wait for a turn to log in to Pulse, holding it until the login is done."""
+        queued = monotonic()
+        await self._login_slots.acquire()
+        released = False
+
+        def release(timed_out: bool = False) -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._login_slots.release()
+            if timed_out:
+                self.slow_logins += 1
+                LOG.warning(
+                    "%s: Pulse login still running after %ds, letting other "
+                    "logins go ahead",
+                    ADTPULSE_DOMAIN,
+                    MAX_LOGIN_SLOT_HOLD,
+                )
+
+        timer = get_running_loop().call_later(MAX_LOGIN_SLOT_HOLD, release, True)
+        try:
+            now = monotonic()
+            start = max(now, self._next_login)
+            self._next_login = start + uniform(*LOGIN_SPACING)
+            if start > now:
+                await sleep(start - now)
+            waited = monotonic() - queued
+            self.logins += 1
+            if waited > 0.001:
+                self.delayed_logins += 1
+                self.login_wait_seconds += waited
+                LOG.debug("%s: waited %.1fs to log in", ADTPULSE_DOMAIN, waited)
+            yield
+        finally:
+            timer.cancel()
+            release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return login counts for diagnostics."""
+        return {
+            "logins": self.logins,
+            "delayed_logins": self.delayed_logins,
+            "login_wait_seconds": round(self.login_wait_seconds, 1),
+            "slow_logins": self.slow_logins,
+        }
+
+
+def get_supervisor(hass: HomeAssistant) -> ADTPulseSupervisor:
+    """Return the supervisor of the ADT Pulse config entries, creating it."""
+    if DATA_SUPERVISOR not in hass.data:
+        hass.data[DATA_SUPERVISOR] = ADTPulseSupervisor()
+    return hass.data[DATA_SUPERVISOR]
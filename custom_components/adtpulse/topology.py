@@ -0,0 +1,194 @@
+"""Cached ADT Pulse site topology and last known state."""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import Any, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from pyadtpulse.alarm_panel import ADTPulseAlarmPanel
+from pyadtpulse.gateway import ADTPulseGateway
+from pyadtpulse.site import ADTPulseSite
+from pyadtpulse.zones import ADTPulseZoneData, ADTPulseZones
+
+from .const import ADTPULSE_DOMAIN
+from .utils import get_site_zones
+
+LOG = getLogger(__name__)
+
+STORAGE_VERSION = 1
+# seconds to coalesce saves of the last known state
+SAVE_DELAY = 60
+
+GATEWAY_FIELDS = (
+    "manufacturer",
+    "model",
+    "serial_number",
+    "firmware_version",
+    "hardware_version",
+    "primary_connection_type",
+    "broadband_connection_status",
+    "cellular_connection_status",
+    "broadband_lan_mac",
+    "device_lan_mac",
+)
+
+
+class ADTPulseCachedSite:
+    """A site restored from the topology store, with its last known state.
+
+    It stands in for the ADT Pulse site until the service has logged in, so
+    entities can be created before then.  It isn't connected to Pulse, so it
+    only has what the entities read: the id, name, alarm panel, gateway and
+    zones.
+    """
+
+    __slots__ = ("id", "name", "alarm_control_panel", "gateway", "zones_as_dict")
+
+    def __init__(self, site_id: str, name: str):
+        """Initialize the cached site.
+
+        Args:
+            site_id (str): site id
+            name (str): site name
+        """
+        self.id = site_id
+        self.name = name
+        self.alarm_control_panel = ADTPulseAlarmPanel()
+        self.gateway = ADTPulseGateway()
+        self.zones_as_dict = ADTPulseZones()
+
+
+def _serialize_site(site: ADTPulseSite) -> dict[str, Any]:
+    alarm = site.alarm_control_panel
+    gateway = site.gateway
+    zones = get_site_zones(site)
+    return {
+        "id": site.id,
+        "name": site.name,
+        "alarm": {
+            "status": alarm.status,
+            "manufacturer": alarm.manufacturer,
+            "model": alarm.model,
+        },
+        "gateway": {
+            "is_online": gateway.is_online,
+            **{name: getattr(gateway, name) for name in GATEWAY_FIELDS},
+        },
+        "zones": [
+            {
+                "zone_id": zone_id,
+                "name": zone.name,
+                "id_": zone.id_,
+                "tags": list(zone.tags),
+                "status": zone.status,
+                "state": zone.state,
+                "last_activity_timestamp": zone.last_activity_timestamp,
+            }
+            for zone_id, zone in zones.items()
+        ],
+    }
+
+
+def _restore_alarm(alarm: ADTPulseAlarmPanel, data: dict[str, Any]) -> None:
+    alarm.manufacturer = data["manufacturer"]
+    alarm.model = data["model"]
+    try:
+        alarm.status = data["status"]
+    except ValueError:
+        LOG.debug("Not restoring unknown alarm status %s", data["status"])
+
+
+def _restore_gateway(gateway: ADTPulseGateway, data: dict[str, Any]) -> None:
+    for name in GATEWAY_FIELDS:
+        if data.get(name) is not None:
+            setattr(gateway, name, data[name])
+    gateway.is_online = data["is_online"]
+
+
+def _restore_site(data: dict[str, Any]) -> ADTPulseCachedSite:
+    site = ADTPulseCachedSite(data["id"], data["name"])
+    _restore_alarm(site.alarm_control_panel, data["alarm"])
+    _restore_gateway(site.gateway, data["gateway"])
+    for zone in data["zones"]:
+        site.zones_as_dict[zone["zone_id"]] = ADTPulseZoneData(
+            zone["name"],
+            zone["id_"],
+            tuple(zone["tags"]),
+            zone["status"],
+            zone["state"],
+            zone["last_activity_timestamp"],
+        )
+    return site
+
+
+def topology_changed(
+    old_sites: Iterable[ADTPulseSite], new_sites: Iterable[ADTPulseSite]
+) -> bool:
+    """Return whether sites or their zones were added or removed.
+
+    Args:
+        old_sites (Iterable[ADTPulseSite]): sites entities were created for
+        new_sites (Iterable[ADTPulseSite]): sites reported by ADT Pulse
+
+    Returns:
+        bool: True if entities need to be recreated
+    """
+
+    def zone_ids(sites: Iterable[ADTPulseSite]) -> dict[str, set[int]]:
+        return {site.id: set(get_site_zones(site)) for site in sites}
+
+    return zone_ids(old_sites) != zone_ids(new_sites)
+
+
+class ADTPulseTopologyStore:
+    """Persist the sites of a config entry and their last known state.
+
+    Entities are created from the stored sites at startup so they don't wait
+    for the Pulse login, which can take a long time or fail.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        """Initialize the store.
+
+        Args:
+            hass (HomeAssistant): hass object
+            entry_id (str): config entry id
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{ADTPULSE_DOMAIN}.topology.{entry_id}"
+        )
+
+    async def async_load_sites(self) -> list[ADTPulseCachedSite] | None:
+        """Load the stored sites.
+
+        Returns:
+            list[ADTPulseCachedSite] | None: sites with their last known
+                state, None if nothing usable is stored
+        """
+        data = await self._store.async_load()
+        if not data or not data.get("sites"):
+            return None
+        try:
+            return [_restore_site(site) for site in data["sites"]]
+        except (KeyError, TypeError, ValueError) as ex:
+            LOG.warning("%s: ignoring invalid cached topology: %s", ADTPULSE_DOMAIN, ex)
+            return None
+
+    async def async_save(self, sites: Iterable[ADTPulseSite]) -> None:
+        """Save sites now."""
+        await self._store.async_save(
+            {"sites": [_serialize_site(site) for site in sites]}
+        )
+
+    @callback
+    def async_schedule_save(self, sites: Iterable[ADTPulseSite]) -> None:
+        """Save sites after SAVE_DELAY, coalescing saves until then."""
+        self._store.async_delay_save(
+            lambda: {"sites": [_serialize_site(site) for site in sites]}, SAVE_DELAY
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the stored sites."""
+        await self._store.async_remove()
@@ -2,38 +2,85 @@
 
 from __future__ import annotations
 
-from homeassistant.core import HomeAssistant
+from logging import getLogger
+from datetime import datetime
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.util import slugify
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util import as_local, slugify
 from pyadtpulse.const import STATE_OK, STATE_ONLINE
 from pyadtpulse.site import ADTPulseSite
-from pyadtpulse.zones import ADTPulseZoneData
+from pyadtpulse.zones import ADTPulseZoneData, ADTPulseZones
+
+from .const import ADTPULSE_DOMAIN, ENTITY_MIGRATION_VERSION
 
-from .const import ADTPULSE_DOMAIN
+LOG = getLogger(__name__)
 
+# platforms whose entities had their names migrated
+MIGRATED_PLATFORMS = ("alarm_control_panel", "binary_sensor")
 
-def migrate_entity_name(
-    hass: HomeAssistant, site: ADTPulseSite, platform_name: str, entity_uid: str
+
+@callback
+def async_migrate_entities(
+    hass: HomeAssistant, entry: ConfigEntry, sites: list[ADTPulseSite]
 ) -> None:
-    """Migrate old entity names."""
-    registry = er.async_get(hass)
-    if registry is None:
+    """Migrate old entity names of a config entry in a single pass.
+
+    Entities are changed to has_entity_name with no name, and site names in
+    entity ids are replaced by site ids.  The config entry's minor version
+    records the migration so it only runs once.
+
+    Args:
+        hass (HomeAssistant): hass object
+        entry (ConfigEntry): config entry whose entities are migrated
+        sites (list[ADTPulseSite]): sites of the config entry
+    """
+    if entry.minor_version >= ENTITY_MIGRATION_VERSION:
         return
-    # this seems backwards
-    entity_id = registry.async_get_entity_id(
-        platform_name,
-        ADTPULSE_DOMAIN,
-        entity_uid,
-    )
-    if entity_id is not None:
+    registry = er.async_get(hass)
+    slugified_site_names = {site.id: slugify(site.name) for site in sites}
+    updates: dict[str, dict[str, Any]] = {}
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if registry_entry.domain not in MIGRATED_PLATFORMS:
+            continue
+        entity_id = registry_entry.entity_id
+        entity_updates: dict[str, Any] = {}
         # change has_entity_name to True and set name to None for devices
-        registry.async_update_entity(entity_id, has_entity_name=True, name=None)
+        if not registry_entry.has_entity_name or registry_entry.name is not None:
+            entity_updates.update(has_entity_name=True, name=None)
         # rename site name to site id for entities which have site name
-        slugified_site_name = slugify(site.name)
-        if slugified_site_name in entity_id:
-            registry.async_update_entity(
-                entity_id, new_entity_id=entity_id.replace(slugified_site_name, site.id)
+        for site_id, slugified_site_name in slugified_site_names.items():
+            if site_id in registry_entry.unique_id and slugified_site_name in entity_id:
+                entity_updates["new_entity_id"] = entity_id.replace(
+                    slugified_site_name, site_id
+                )
+                break
+        if entity_updates:
+            updates[entity_id] = entity_updates
+    for entity_id, entity_updates in updates.items():
+        new_entity_id = entity_updates.get("new_entity_id")
+        if new_entity_id is not None and registry.async_is_registered(new_entity_id):
+            LOG.warning(
+                "Not renaming %s to %s, entity id already exists",
+                entity_id,
+                new_entity_id,
             )
+            del entity_updates["new_entity_id"]
+            if not entity_updates:
+                continue
+        registry.async_update_entity(entity_id, **entity_updates)
+    LOG.debug(
+        "%s: migrated %d entities of %s",
+        ADTPULSE_DOMAIN,
+        len(updates),
+        entry.title,
+    )
+    hass.config_entries.async_update_entry(
+        entry, minor_version=ENTITY_MIGRATION_VERSION
+    )
 
 
 def get_gateway_unique_id(site: ADTPulseSite) -> str:
@@ -46,6 +93,32 @@ def get_alarm_unique_id(site: ADTPulseSite) -> str:
     return f"adt_pulse_alarm_{site.id}"
 
 
+def get_alarm_device_info(site: ADTPulseSite) -> DeviceInfo:
+    """Get device info for the alarm panel.
+
+    We set the identifiers to the site id since it is unique across all sites
+    and the zones can be identified by site id and zone name
+    """
+    return DeviceInfo(
+        identifiers={(ADTPULSE_DOMAIN, site.id)},
+        manufacturer=site.alarm_control_panel.manufacturer,
+        model=site.alarm_control_panel.model,
+        via_device=(ADTPULSE_DOMAIN, get_gateway_unique_id(site)),
+        name=f"ADT Alarm Panel - Site {site.id}",
+    )
+
+
+def get_site_zones(site: ADTPulseSite) -> ADTPulseZones:
+    """Return the zones of a site, empty if it has none.
+
+    zones_as_dict raises RuntimeError instead of returning an empty dict.
+    """
+    try:
+        return site.zones_as_dict
+    except RuntimeError:
+        return ADTPulseZones()
+
+
 def zone_is_open(zone: ADTPulseZoneData) -> bool:
     """Determine if a zone is opened."""
     return zone.state != STATE_OK
@@ -56,12 +129,30 @@ def zone_is_in_trouble(zone: ADTPulseZoneData) -> bool:
     return zone.status != STATE_ONLINE
 
 
-def system_can_be_armed(site: ADTPulseSite) -> bool:
-    """Determine is the system is able to be armed without being forced."""
-    zones = site.zones_as_dict
-    if zones is None:
-        return False
-    for zone in zones.values():
-        if zone_is_open(zone) or zone_is_in_trouble(zone):
-            return False
-    return True
+class LocalTimestampCache:
+    """Convert a Pulse timestamp to local time, caching the last conversion.
+
+    Pulse timestamps only change when the data does, so entities keep one of
+    these per timestamp they display.
+    """
+
+    __slots__ = ("_timestamp", "_local_time")
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._timestamp: float | None = None
+        self._local_time: datetime | None = None
+
+    def convert(self, timestamp: float) -> datetime:
+        """Return the timestamp as a local datetime.
+
+        Args:
+            timestamp (float): POSIX timestamp
+
+        Returns:
+            datetime: local time of the timestamp
+        """
+        if self._local_time is None or timestamp != self._timestamp:
+            self._local_time = as_local(datetime.fromtimestamp(timestamp))
+            self._timestamp = timestamp
+        return self._local_time
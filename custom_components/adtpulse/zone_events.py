@@ -0,0 +1,131 @@
+"""Recent zone events of ADT Pulse sites."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Collection
+
+# zone events kept per site
+ZONE_EVENT_CAPACITY = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneEvent:
+    """A change of a zone's state, status or last activity."""
+
+    zone_id: int
+    old_state: str
+    state: str
+    status: str
+    last_activity_timestamp: int
+    received: float
+
+
+class ADTPulseZoneEventBuffer:
+    """Ring buffer of the latest zone events of a site.
+
+    Events are kept in typed arrays with state and status strings stored as
+    indexes into a table, so memory use is fixed by the capacity no matter how
+    busy the site is.  The oldest events are overwritten once it's full.
+    """
+
+    def __init__(self, capacity: int = ZONE_EVENT_CAPACITY):
+        """Initialize the buffer.
+
+        Args:
+            capacity (int): maximum number of events kept
+        """
+        self._capacity = capacity
+        self._zone_ids = array("I", [0]) * capacity
+        self._old_states = array("H", [0]) * capacity
+        self._states = array("H", [0]) * capacity
+        self._statuses = array("H", [0]) * capacity
+        self._last_activity = array("q", [0]) * capacity
+        self._received = array("d", [0.0]) * capacity
+        self._strings: list[str] = []
+        self._string_indexes: dict[str, int] = {}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of events kept."""
+        return self._count
+
+    @property
+    def last_received(self) -> float | None:
+        """Return when the newest event was received, None if there are none."""
+        if not self._count:
+            return None
+        return self._received[(self._next - 1) % self._capacity]
+
+    def _intern(self, value: str) -> int:
+        index = self._string_indexes.get(value)
+        if index is None:
+            index = self._string_indexes[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def append(
+        self,
+        zone_id: int,
+        old_state: str,
+        state: str,
+        status: str,
+        last_activity_timestamp: int,
+        received: float,
+    ) -> None:
+        """Add an event, overwriting the oldest if full.
+
+        Args:
+            zone_id (int): zone id
+            old_state (str): zone state before the event
+            state (str): zone state after the event
+            status (str): zone status after the event
+            last_activity_timestamp (int): last activity reported by ADT
+            received (float): time the update was received
+        """
+        i = self._next
+        self._zone_ids[i] = zone_id
+        self._old_states[i] = self._intern(old_state)
+        self._states[i] = self._intern(state)
+        self._statuses[i] = self._intern(status)
+        self._last_activity[i] = last_activity_timestamp
+        self._received[i] = received
+        self._next = (i + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def query(
+        self, since: float, zone_ids: Collection[int] | None = None
+    ) -> list[ZoneEvent]:
+        """Return events received since a time, oldest first.
+
+        Args:
+            since (float): earliest receive time
+            zone_ids (Collection[int] | None): zones to return, None for all
+
+        Returns:
+            list[ZoneEvent]: the events
+        """
+        strings = self._strings
+        events: list[ZoneEvent] = []
+        # newest first, events are appended in receive order
+        for n in range(1, self._count + 1):
+            i = (self._next - n) % self._capacity
+            if self._received[i] < since:
+                break
+            zone_id = self._zone_ids[i]
+            if zone_ids is not None and zone_id not in zone_ids:
+                continue
+            events.append(
+                ZoneEvent(
+                    zone_id,
+                    strings[self._old_states[i]],
+                    strings[self._states[i]],
+                    strings[self._statuses[i]],
+                    self._last_activity[i],
+                    self._received[i],
+                )
+            )
+        events.reverse()
+        return events
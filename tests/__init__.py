@@ -0,0 +1 @@
+"""Tests for the ADT Pulse integration."""
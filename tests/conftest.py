@@ -0,0 +1,14 @@
+"""Fixtures for the ADT Pulse tests.
+
+The tests run against the mock Pulse portal of the benchmarks.
+"""
+
+from __future__ import annotations
+
+from benchmarks.conftest import (  # noqa: F401
+    allow_mock_service_host,
+    mock_portal,
+    scenario_name,
+)
+
+pytest_plugins = "pytest_homeassistant_custom_component"
@@ -0,0 +1,78 @@
+"""Recorder exclusion of the ADT Pulse entities' volatile attributes."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import partial
+
+import pytest
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from benchmarks.helpers import setup_mock_entry
+from benchmarks.mock_portal import MockPulsePortal
+
+pytestmark = pytest.mark.parametrize("expected_lingering_tasks", [True])
+
+ALARM_VOLATILE = frozenset({"last_update_time"})
+GATEWAY_VOLATILE = frozenset(
+    {"current_poll_interval", "initial_poll_interval", "next_update", "last_update"}
+)
+ZONE_VOLATILE = frozenset({"last_activity_timestamp"})
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(recorder_db_url, enable_custom_integrations):
+    """Enable custom integrations, the recorder database has to come first."""
+    yield
+
+
+async def test_volatile_attributes_not_recorded(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    mock_portal: tuple[MockPulsePortal, str],
+) -> None:
+    """Volatile attributes are on the states but not in the recorded states."""
+    start = utcnow() - timedelta(minutes=1)
+    portal, url = mock_portal
+    entry = await setup_mock_entry(hass, portal, url)
+    await async_wait_recording_done(hass)
+
+    volatile_by_entity: dict[str, frozenset[str]] = {}
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        if entity.domain == "alarm_control_panel":
+            volatile_by_entity[entity.entity_id] = ALARM_VOLATILE
+        elif entity.unique_id.startswith("adt_pulse_gateway_"):
+            volatile_by_entity[entity.entity_id] = GATEWAY_VOLATILE
+        elif entity.unique_id.startswith("adt_pulse_sensor_"):
+            volatile_by_entity[entity.entity_id] = ZONE_VOLATILE
+    assert {ALARM_VOLATILE, GATEWAY_VOLATILE, ZONE_VOLATILE} <= set(
+        volatile_by_entity.values()
+    )
+    for entity_id, volatile in volatile_by_entity.items():
+        state = hass.states.get(entity_id)
+        assert state is not None
+        assert volatile <= state.attributes.keys(), entity_id
+
+    history = await recorder_mock.async_add_executor_job(
+        partial(
+            get_significant_states,
+            hass,
+            start,
+            entity_ids=list(volatile_by_entity),
+            significant_changes_only=False,
+        )
+    )
+    assert history.keys() == volatile_by_entity.keys()
+    for entity_id, states in history.items():
+        for state in states:
+            assert not volatile_by_entity[entity_id] & state.attributes.keys(), (
+                entity_id
+            )
+    assert await hass.config_entries.async_unload(entry.entry_id)